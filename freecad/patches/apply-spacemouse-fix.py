@@ -23,166 +23,373 @@ UI:
 Usage:
     python3 apply-spacemouse-fix.py /path/to/freecad-source
     python3 apply-spacemouse-fix.py --check /path/to/freecad-source
+    python3 apply-spacemouse-fix.py --diff /path/to/freecad-source > spacemouse.patch
 """
 
+import contextlib
+import difflib
+import json
+import mmap
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+# Source files touched by the fixes below, resolved in one tree scan.
+TARGET_FILES = {
+    "GuiNativeEventLinux.cpp",
+    "GuiNativeEventLinux.h",
+    "NavigationStyle.cpp",
+    "DlgCustomizeSpaceball.cpp",
+    "MainWindow.cpp",
+    "NavlibCmds.cpp",
+}
+
+# Directories that never contain FreeCAD sources but can be huge (build trees,
+# VCS metadata, virtualenvs).
+SKIP_DIRS = {".git", "build", ".venv", "node_modules", "__pycache__"}
+
+# Directories on the way to the targets (src/Gui, src/Gui/3Dconnexion,
+# src/Gui/Dialogs). They are scanned before their siblings so the early exit in
+# find_files() usually triggers before the rest of the tree is visited.
+PRIORITY_DIRS = {"src", "Gui", "3Dconnexion", "Dialogs"}
+
+
+def find_files(base_dir, filenames):
+    """Find several files anywhere in the source tree with a single scan.
+
+    Returns a dict mapping each name in `filenames` to its first path found,
+    or None if it does not exist. Depth-first, visiting PRIORITY_DIRS before
+    their siblings, and stops early once every name is found.
+    """
+    found = dict.fromkeys(filenames)
+    missing = set(filenames)
+    stack = [base_dir]
+    while stack and missing:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry)
+                elif entry.name in missing:
+                    found[entry.name] = entry.path
+                    missing.discard(entry.name)
+        # The stack pops from the end, so push priority directories last.
+        subdirs.sort(key=lambda e: e.name in PRIORITY_DIRS)
+        stack.extend(e.path for e in subdirs)
+    return found
+
+
+def replace_once(content, old, new):
+    """Replace the first occurrence of `old` in a single scan.
+
+    Returns (content, found); `content` is returned unchanged if `old` is absent.
+    """
+    head, sep, tail = content.partition(old)
+    if not sep:
+        return content, False
+    return head + new + tail, True
+
+
+def splice(content, edits):
+    """Apply (offset, old, new) edits found in `content` with a single join.
+
+    The offsets come from content.find() on the unmodified text and must not
+    overlap; they may be given in any order.
+    """
+    parts = []
+    pos = 0
+    for offset, old, new in sorted(edits):
+        parts.append(content[pos:offset])
+        parts.append(new)
+        pos = offset + len(old)
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
+class PatchBuffer:
+    """In-memory copy of one source file shared by all fixes that touch it.
+
+    The file is read once; fixes edit `content` and the result is written
+    back with a single flush() after every fix has run. Fixes that need
+    several edits work on a local copy and call update() only on success,
+    so a failed fix never leaves a half-applied change behind.
+    """
+
+    def __init__(self, path, rel):
+        self.path = path
+        self.rel = rel  # path relative to the source dir, for log messages
+        with open(path) as f:
+            self.content = f.read()
+        self.original = self.content
+        self.dirty = False
+
+    def apply(self, old, new):
+        """Replace the first occurrence of `old`. Returns False if not found."""
+        content, found = replace_once(self.content, old, new)
+        self.update(content)
+        return found
+
+    def update(self, content):
+        """Replace the whole buffer content."""
+        if content != self.content:
+            self.content = content
+            self.dirty = True
+
+    def diff(self):
+        """Unified diff of the pending changes, with a/ b/ prefixes for patch -p1."""
+        if not self.dirty:
+            return []
+        return difflib.unified_diff(
+            self.original.splitlines(keepends=True),
+            self.content.splitlines(keepends=True),
+            f"a/{self.rel}",
+            f"b/{self.rel}",
+        )
+
+    def flush(self):
+        """Write the buffer back to disk if any fix changed it."""
+        if self.dirty:
+            with open(self.path, "w") as f:
+                f.write(self.content)
+            self.dirty = False
+
+
+@contextlib.contextmanager
+def map_source(path):
+    """Map a source file read-only for the --check substring tests.
+
+    Yields an mmap (or b"" for an empty file); both support bytes find() and
+    bytes regex search without copying the file into a Python str.
+    """
+    with open(path, "rb") as f:
+        try:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # mmap refuses zero-length files
+            yield b""
+            return
+        with m:
+            yield m
+
+
+@dataclass(frozen=True)
+class PatchSpec:
+    """A fix that swaps one code block for another in a single file.
+
+    Fixes that need several dependent edits (1, 3 and 6) stay as functions;
+    the single-replacement ones are plain data rows run by apply_spec().
+    """
+
+    target: str
+    old: str
+    new: str
+    # The fix counts as already applied when all of these are present.
+    patched_markers: tuple
+    done_msg: str
+    fail_what: str
+    fail_hint: Optional[str] = "The code may have changed in this FreeCAD version."
+    already_msg: str = "already patched"
+    missing_msg: Optional[str] = None
+    missing_ok: bool = False
+
+
+def apply_spec(source_dir, buffers, spec):
+    """Apply one PatchSpec to its target buffer. Returns True on success."""
+    buf = buffers.get(spec.target)
+    if not buf:
+        print(f"  {spec.missing_msg or f'SKIP: {spec.target} not found'}")
+        return spec.missing_ok
+
+    rel = buf.rel
+    if all(marker in buf.content for marker in spec.patched_markers):
+        print(f"  OK:   {rel} ({spec.already_msg})")
+        return True
+
+    if not buf.apply(spec.old, spec.new):
+        print(f"  FAIL: Could not find {spec.fail_what} in {rel}")
+        if spec.fail_hint:
+            print(f"        {spec.fail_hint}")
+        return False
+
+    print(f"  DONE: {rel} - {spec.done_msg}")
+    return True
 
 
-def find_file(base_dir, filename):
-    """Find a file anywhere in the source tree."""
-    for root, _dirs, files in os.walk(base_dir):
-        if filename in files:
-            return os.path.join(root, filename)
-    return None
+# Written into the source dir after a run where every fix succeeded.
+SENTINEL_NAME = ".spacemouse-patched"
+
+
+def _file_stamp(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def sentinel_is_current(source_dir):
+    """True if the sentinel exists and no file it records has changed since."""
+    try:
+        with open(os.path.join(source_dir, SENTINEL_NAME)) as f:
+            sentinel = json.load(f)
+        if sentinel["patcher"] != _file_stamp(__file__):
+            return False
+        files = sentinel["files"]
+        return bool(files) and all(
+            _file_stamp(os.path.join(source_dir, rel)) == stamp for rel, stamp in files.items()
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+
+def write_sentinel(source_dir, buffers):
+    """Record the stamps of all patched files (and of this script)."""
+    sentinel = {
+        "patcher": _file_stamp(__file__),
+        "files": {buf.rel: _file_stamp(buf.path) for buf in buffers.values()},
+    }
+    try:
+        with open(os.path.join(source_dir, SENTINEL_NAME), "w") as f:
+            json.dump(sentinel, f, indent=2)
+    except OSError:
+        pass  # Only an optimization for re-runs
 
 
 # ---------------------------------------------------------------------------
 # Fix 1: Event coalescing (PR #28110)
 # ---------------------------------------------------------------------------
-def patch_poll_spacenav(source_dir):
+POLL_MOTION_OLD = "mainApp->postMotionEvent(motionDataArray);\n                break;"
+POLL_MOTION_NEW = "hasMotion = true;\n                break;"
+POLL_DECL_OLD = "spnav_event ev;\n"
+POLL_DECL_NEW = "spnav_event ev;\n    bool hasMotion = false;\n"
+POLL_END_OLD = (
+    "mainApp->postButtonEvent(ev.button.bnum, ev.button.press);\n"
+    "                break;\n"
+    "            }\n"
+    "        }\n"
+    "    }\n"
+)
+POLL_END_NEW = (
+    "mainApp->postButtonEvent(ev.button.bnum, ev.button.press);\n"
+    "                break;\n"
+    "            }\n"
+    "        }\n"
+    "    }\n"
+    "    if (hasMotion) {\n"
+    "        mainApp->postMotionEvent(motionDataArray);\n"
+    "    }\n"
+)
+
+
+def patch_poll_spacenav(source_dir, buffers):
     """Fix 1: Event coalescing in pollSpacenav().
 
     Before: Every spnav motion event is posted individually via Qt.
     After:  Only the latest motion state is posted once per poll cycle.
     """
-    filepath = find_file(source_dir, "GuiNativeEventLinux.cpp")
-    if not filepath:
+    buf = buffers.get("GuiNativeEventLinux.cpp")
+    if not buf:
         print("  SKIP: GuiNativeEventLinux.cpp not found (not a Linux build?)")
         return False
 
-    with open(filepath) as f:
-        content = f.read()
+    content = buf.content
 
     if "hasMotion" in content:
-        print(f"  OK:   {os.path.relpath(filepath, source_dir)} (already patched)")
+        print(f"  OK:   {buf.rel} (already patched)")
         return True
 
-    # Find and replace the postMotionEvent call inside the while loop
-    old = "mainApp->postMotionEvent(motionDataArray);\n                break;"
-    new = "hasMotion = true;\n                break;"
-
-    if old not in content:
-        print(
-            f"  FAIL: Could not find postMotionEvent pattern in {os.path.relpath(filepath, source_dir)}"
-        )
+    # Locate all anchors first, then build the patched file in one splice.
+    # The postMotionEvent call inside the while loop becomes a flag:
+    motion_at = content.find(POLL_MOTION_OLD)
+    if motion_at == -1:
+        print(f"  FAIL: Could not find postMotionEvent pattern in {buf.rel}")
         print("        The code may have changed in this FreeCAD version.")
         return False
 
-    content = content.replace(old, new, 1)
-
-    # Add 'bool hasMotion = false;' after 'spnav_event ev;'
-    content = content.replace(
-        "spnav_event ev;\n", "spnav_event ev;\n    bool hasMotion = false;\n", 1
-    )
-
-    # Add the if(hasMotion) block immediately after the while loop closes.
+    # The if(hasMotion) block goes immediately after the while loop closes.
     # Pattern anchors on the button handler so it can't match other functions,
     # but stops at the while-end so it works whether or not the disconnect-
     # detection block (PR #28915) follows. On versions with PR #28915 merged
     # (FreeCAD 1.1.1+, main), the disconnect block ends up below our insertion.
-    old_end = (
-        "mainApp->postButtonEvent(ev.button.bnum, ev.button.press);\n"
-        "                break;\n"
-        "            }\n"
-        "        }\n"
-        "    }\n"
-    )
-    new_end = (
-        "mainApp->postButtonEvent(ev.button.bnum, ev.button.press);\n"
-        "                break;\n"
-        "            }\n"
-        "        }\n"
-        "    }\n"
-        "    if (hasMotion) {\n"
-        "        mainApp->postMotionEvent(motionDataArray);\n"
-        "    }\n"
-    )
-
-    if old_end not in content:
-        print(
-            f"  FAIL: Could not find pollSpacenav end pattern in {os.path.relpath(filepath, source_dir)}"
-        )
+    end_at = content.find(POLL_END_OLD)
+    if end_at == -1:
+        print(f"  FAIL: Could not find pollSpacenav end pattern in {buf.rel}")
         print("        (looking for postButtonEvent + closing braces)")
         return False
 
-    content = content.replace(old_end, new_end, 1)
+    edits = [(motion_at, POLL_MOTION_OLD, POLL_MOTION_NEW), (end_at, POLL_END_OLD, POLL_END_NEW)]
+    # 'bool hasMotion = false;' goes after 'spnav_event ev;'
+    decl_at = content.find(POLL_DECL_OLD)
+    if decl_at != -1:
+        edits.append((decl_at, POLL_DECL_OLD, POLL_DECL_NEW))
+    content = splice(content, edits)
 
-    with open(filepath, "w") as f:
-        f.write(content)
+    buf.update(content)
 
-    print(f"  DONE: {os.path.relpath(filepath, source_dir)} - Event coalescing applied")
+    print(f"  DONE: {buf.rel} - Event coalescing applied")
     return True
 
 
 # ---------------------------------------------------------------------------
 # Fix 2: Batched camera updates (PR #28110)
 # ---------------------------------------------------------------------------
-def patch_process_motion_event(source_dir):
+# The three lines at the end of processMotionEvent() that set camera properties.
+# Tolerates whitespace differences between FreeCAD versions, e.g.
+# multVec(dir,dir) vs multVec(dir, dir).
+MOTION_CAMERA_RE = re.compile(
+    r"^(?P<indent>[ \t]*)camera->orientation\.setValue\(newRotation\);\s*\n"
+    r"\s*camera->orientation\.getValue\(\)\.multVec\((?P<args>dir\s*,\s*dir)\);\s*\n"
+    r"\s*camera->position = newPosition \+ \(dir \* translationFactor\);",
+    re.MULTILINE,
+)
+MOTION_CAMERA_BYTES_RE = re.compile(MOTION_CAMERA_RE.pattern.encode(), re.MULTILINE)
+
+
+def _batched_camera_update(match):
+    """Replacement for MOTION_CAMERA_RE, keeping the original indent and multVec() style."""
+    indent = match.group("indent")
+    return (
+        f"{indent}newRotation.multVec({match.group('args')});\n"
+        f"{indent}SbVec3f finalPosition = newPosition + (dir * translationFactor);\n"
+        "\n"
+        f"{indent}// Batch camera property changes into a single Coin3D redraw\n"
+        f"{indent}camera->enableNotify(false);\n"
+        f"{indent}camera->orientation.setValue(newRotation);\n"
+        f"{indent}camera->position = finalPosition;\n"
+        f"{indent}camera->enableNotify(true);\n"
+        f"{indent}camera->touch();"
+    )
+
+
+def patch_process_motion_event(source_dir, buffers):
     """Fix 2: Batched camera updates in processMotionEvent().
 
     Before: camera->orientation and camera->position each trigger a separate redraw.
     After:  Notifications suppressed during update, single touch() at the end.
     """
-    filepath = find_file(source_dir, "NavigationStyle.cpp")
-    if not filepath:
+    buf = buffers.get("NavigationStyle.cpp")
+    if not buf:
         print(f"  FAIL: NavigationStyle.cpp not found in {source_dir}")
         return False
 
-    with open(filepath) as f:
-        content = f.read()
+    content = buf.content
 
     if "enableNotify(false)" in content:
-        print(f"  OK:   {os.path.relpath(filepath, source_dir)} (already patched)")
+        print(f"  OK:   {buf.rel} (already patched)")
         return True
 
-    # Pattern: the three lines at the end of processMotionEvent that set camera properties
-    # Works with various whitespace/formatting styles
-    patterns = [
-        # Style 1: spaces around operators (formatted)
-        (
-            "    camera->orientation.setValue(newRotation);\n"
-            "    camera->orientation.getValue().multVec(dir,dir);\n"
-            "    camera->position = newPosition + (dir * translationFactor);",
-            "    newRotation.multVec(dir,dir);\n"
-            "    SbVec3f finalPosition = newPosition + (dir * translationFactor);\n"
-            "\n"
-            "    // Batch camera property changes into a single Coin3D redraw\n"
-            "    camera->enableNotify(false);\n"
-            "    camera->orientation.setValue(newRotation);\n"
-            "    camera->position = finalPosition;\n"
-            "    camera->enableNotify(true);\n"
-            "    camera->touch();",
-        ),
-        # Style 2: with space in multVec(dir, dir)
-        (
-            "    camera->orientation.setValue(newRotation);\n"
-            "    camera->orientation.getValue().multVec(dir, dir);\n"
-            "    camera->position = newPosition + (dir * translationFactor);",
-            "    newRotation.multVec(dir, dir);\n"
-            "    SbVec3f finalPosition = newPosition + (dir * translationFactor);\n"
-            "\n"
-            "    // Batch camera property changes into a single Coin3D redraw\n"
-            "    camera->enableNotify(false);\n"
-            "    camera->orientation.setValue(newRotation);\n"
-            "    camera->position = finalPosition;\n"
-            "    camera->enableNotify(true);\n"
-            "    camera->touch();",
-        ),
-    ]
-
-    for old, new in patterns:
-        if old in content:
-            content = content.replace(old, new, 1)
-            with open(filepath, "w") as f:
-                f.write(content)
-            print(
-                f"  DONE: {os.path.relpath(filepath, source_dir)} - Batched camera updates applied"
-            )
-            return True
+    content, count = MOTION_CAMERA_RE.subn(_batched_camera_update, content, count=1)
+    if count:
+        buf.update(content)
+        print(f"  DONE: {buf.rel} - Batched camera updates applied")
+        return True
 
     print("  FAIL: Could not find processMotionEvent camera update pattern in")
-    print(f"        {os.path.relpath(filepath, source_dir)}")
+    print(f"        {buf.rel}")
     print("        The code may have changed in this FreeCAD version.")
     return False
 
@@ -190,7 +397,78 @@ def patch_process_motion_event(source_dir):
 # ---------------------------------------------------------------------------
 # Fix 3: Per-axis deadzone (PR #28110)
 # ---------------------------------------------------------------------------
-def patch_per_axis_deadzone(source_dir):
+DEADZONE_CACHE_CLASS = (
+    "\n// Cached per-axis deadzone values, auto-updated via Observer when user.cfg changes.\n"
+    "class Gui::DeadzoneCache: public ParameterGrp::ObserverType\n"
+    "{\n"
+    "public:\n"
+    "    static constexpr std::array<const char*, 6> keys = {\n"
+    '        "PanLRDeadzone",\n'
+    '        "PanUDDeadzone",\n'
+    '        "ZoomDeadzone",\n'
+    '        "TiltDeadzone",\n'
+    '        "RollDeadzone",\n'
+    '        "SpinDeadzone",\n'
+    "    };\n"
+    "\n"
+    "    std::array<int, 6> values {};\n"
+    "\n"
+    "    explicit DeadzoneCache(ParameterGrp::handle hGrp)\n"
+    "        : hGrp(std::move(hGrp))\n"
+    "    {\n"
+    "        loadAll();\n"
+    "        this->hGrp->Attach(this);\n"
+    "    }\n"
+    "\n"
+    "    ~DeadzoneCache() override\n"
+    "    {\n"
+    "        hGrp->Detach(this);\n"
+    "    }\n"
+    "\n"
+    "    void OnChange(ParameterGrp::SubjectType& /*rCaller*/,\n"
+    "                  ParameterGrp::MessageType reason) override\n"
+    "    {\n"
+    "        for (size_t i = 0; i < keys.size(); i++) {\n"
+    "            if (std::strcmp(reason, keys[i]) == 0) {\n"
+    "                values[i] = static_cast<int>(hGrp->GetInt(keys[i], 0));\n"
+    "                return;\n"
+    "            }\n"
+    "        }\n"
+    "    }\n"
+    "\n"
+    "private:\n"
+    "    void loadAll()\n"
+    "    {\n"
+    "        for (size_t i = 0; i < keys.size(); i++) {\n"
+    "            values[i] = static_cast<int>(hGrp->GetInt(keys[i], 0));\n"
+    "        }\n"
+    "    }\n"
+    "\n"
+    "    ParameterGrp::handle hGrp;\n"
+    "};\n"
+)
+NATIVE_EVENT_CTOR = "Gui::GuiNativeEvent::GuiNativeEvent("
+DEADZONE_MOTION_OLD = (
+    "    if (hasMotion) {\n        mainApp->postMotionEvent(motionDataArray);\n    }"
+)
+DEADZONE_MOTION_NEW = (
+    "    if (hasMotion) {\n"
+    "        // Per-axis deadzone: zero out axes below their individual threshold.\n"
+    "        // Values cached and auto-updated via Observer when user.cfg changes.\n"
+    "        if (dzCache) {\n"
+    "            for (size_t i = 0; i < dzCache->values.size(); i++) {\n"
+    "                int dz = dzCache->values[i];\n"
+    "                if (dz > 0 && std::abs(motionDataArray[i]) < dz) {\n"
+    "                    motionDataArray[i] = 0;\n"
+    "                }\n"
+    "            }\n"
+    "        }\n"
+    "        mainApp->postMotionEvent(motionDataArray);\n"
+    "    }"
+)
+
+
+def patch_per_axis_deadzone(source_dir, buffers):
     """Fix 3: Per-axis deadzone filtering in pollSpacenav().
 
     Adds a Gui::DeadzoneCache class (member of GuiNativeEvent) that reads
@@ -200,22 +478,20 @@ def patch_per_axis_deadzone(source_dir):
     threshold before posting the motion event.
     Applied on top of the event coalescing patch (requires hasMotion block).
     """
-    cpp_path = find_file(source_dir, "GuiNativeEventLinux.cpp")
-    h_path = find_file(source_dir, "GuiNativeEventLinux.h")
-    if not cpp_path:
+    cpp_buf = buffers.get("GuiNativeEventLinux.cpp")
+    h_buf = buffers.get("GuiNativeEventLinux.h")
+    if not cpp_buf:
         print("  SKIP: GuiNativeEventLinux.cpp not found")
         return False
-    if not h_path:
+    if not h_buf:
         print("  SKIP: GuiNativeEventLinux.h not found")
         return False
 
-    with open(cpp_path) as f:
-        cpp = f.read()
-    with open(h_path) as f:
-        header = f.read()
+    cpp = cpp_buf.content
+    header = h_buf.content
 
     if "DeadzoneCache" in cpp:
-        print(f"  OK:   {os.path.relpath(cpp_path, source_dir)} (deadzone already patched)")
+        print(f"  OK:   {cpp_buf.rel} (deadzone already patched)")
         return True
 
     if "hasMotion" not in cpp:
@@ -246,13 +522,10 @@ def patch_per_axis_deadzone(source_dir):
             "private Q_SLOTS:", "    std::unique_ptr<DeadzoneCache> dzCache;\n\nprivate Q_SLOTS:", 1
         )
 
-    with open(h_path, "w") as f:
-        f.write(header)
-
     # --- Patch cpp: add includes, class definition, init, and usage ---
 
     # Add required includes
-    for inc in ["<array>", "<cmath>", "<cstring>"]:
+    for inc in ("<array>", "<cmath>", "<cstring>"):
         if f"#include {inc}" not in cpp:
             cpp = cpp.replace(
                 "#include <App/Application.h>", f"#include {inc}\n#include <App/Application.h>", 1
@@ -269,66 +542,13 @@ def patch_per_axis_deadzone(source_dir):
         )
 
     # Add Gui::DeadzoneCache class definition before the constructor
-    deadzone_cache_class = (
-        "\n// Cached per-axis deadzone values, auto-updated via Observer when user.cfg changes.\n"
-        "class Gui::DeadzoneCache: public ParameterGrp::ObserverType\n"
-        "{\n"
-        "public:\n"
-        "    static constexpr std::array<const char*, 6> keys = {\n"
-        '        "PanLRDeadzone",\n'
-        '        "PanUDDeadzone",\n'
-        '        "ZoomDeadzone",\n'
-        '        "TiltDeadzone",\n'
-        '        "RollDeadzone",\n'
-        '        "SpinDeadzone",\n'
-        "    };\n"
-        "\n"
-        "    std::array<int, 6> values {};\n"
-        "\n"
-        "    explicit DeadzoneCache(ParameterGrp::handle hGrp)\n"
-        "        : hGrp(std::move(hGrp))\n"
-        "    {\n"
-        "        loadAll();\n"
-        "        this->hGrp->Attach(this);\n"
-        "    }\n"
-        "\n"
-        "    ~DeadzoneCache() override\n"
-        "    {\n"
-        "        hGrp->Detach(this);\n"
-        "    }\n"
-        "\n"
-        "    void OnChange(ParameterGrp::SubjectType& /*rCaller*/,\n"
-        "                  ParameterGrp::MessageType reason) override\n"
-        "    {\n"
-        "        for (size_t i = 0; i < keys.size(); i++) {\n"
-        "            if (std::strcmp(reason, keys[i]) == 0) {\n"
-        "                values[i] = static_cast<int>(hGrp->GetInt(keys[i], 0));\n"
-        "                return;\n"
-        "            }\n"
-        "        }\n"
-        "    }\n"
-        "\n"
-        "private:\n"
-        "    void loadAll()\n"
-        "    {\n"
-        "        for (size_t i = 0; i < keys.size(); i++) {\n"
-        "            values[i] = static_cast<int>(hGrp->GetInt(keys[i], 0));\n"
-        "        }\n"
-        "    }\n"
-        "\n"
-        "    ParameterGrp::handle hGrp;\n"
-        "};\n"
+    cpp, found = replace_once(
+        cpp, NATIVE_EVENT_CTOR, DEADZONE_CACHE_CLASS + "\n" + NATIVE_EVENT_CTOR
     )
-
-    constructor_pattern = "Gui::GuiNativeEvent::GuiNativeEvent("
-    if constructor_pattern not in cpp:
-        print(
-            f"  FAIL: Could not find GuiNativeEvent constructor in {os.path.relpath(cpp_path, source_dir)}"
-        )
+    if not found:
+        print(f"  FAIL: Could not find GuiNativeEvent constructor in {cpp_buf.rel}")
         return False
 
-    cpp = cpp.replace(constructor_pattern, deadzone_cache_class + "\n" + constructor_pattern, 1)
-
     # Add dzCache initialization in initSpaceball() after the connect() call.
     # The notifier variable is "SpacenavNotifier" before PR #28915 and
     # "spnavNotifier" after — match either.
@@ -355,36 +575,18 @@ def patch_per_axis_deadzone(source_dir):
     cpp = cpp.replace(connect_pattern, dzCache_init, 1)
 
     # Replace the simple "if (hasMotion) { postMotionEvent }" block
-    old_motion_block = (
-        "    if (hasMotion) {\n        mainApp->postMotionEvent(motionDataArray);\n    }"
-    )
-    new_motion_block = (
-        "    if (hasMotion) {\n"
-        "        // Per-axis deadzone: zero out axes below their individual threshold.\n"
-        "        // Values cached and auto-updated via Observer when user.cfg changes.\n"
-        "        if (dzCache) {\n"
-        "            for (size_t i = 0; i < dzCache->values.size(); i++) {\n"
-        "                int dz = dzCache->values[i];\n"
-        "                if (dz > 0 && std::abs(motionDataArray[i]) < dz) {\n"
-        "                    motionDataArray[i] = 0;\n"
-        "                }\n"
-        "            }\n"
-        "        }\n"
-        "        mainApp->postMotionEvent(motionDataArray);\n"
-        "    }"
-    )
-
-    if old_motion_block not in cpp:
-        print(f"  FAIL: Could not find hasMotion block in {os.path.relpath(cpp_path, source_dir)}")
+    cpp, found = replace_once(cpp, DEADZONE_MOTION_OLD, DEADZONE_MOTION_NEW)
+    if not found:
+        print(f"  FAIL: Could not find hasMotion block in {cpp_buf.rel}")
         return False
 
-    cpp = cpp.replace(old_motion_block, new_motion_block, 1)
-
-    with open(cpp_path, "w") as f:
-        f.write(cpp)
+    # Commit both files together: a header that declares dzCache without
+    # the .cpp defining DeadzoneCache would break the FreeCAD build.
+    h_buf.update(header)
+    cpp_buf.update(cpp)
 
     print(
-        f"  DONE: {os.path.relpath(cpp_path, source_dir)} + {os.path.relpath(h_path, source_dir)} - Per-axis deadzone with member Observer cache applied"
+        f"  DONE: {cpp_buf.rel} + {h_buf.rel} - Per-axis deadzone with member Observer cache applied"
     )
     return True
 
@@ -392,178 +594,173 @@ def patch_per_axis_deadzone(source_dir):
 # ---------------------------------------------------------------------------
 # Fix 4: Button selection sync (#17812)
 # ---------------------------------------------------------------------------
-def patch_button_select(source_dir):
-    """Fix 4: Sync currentIndex with selection in ButtonView::selectButton().
-
-    Before: selectButton() updates the visual selection but not currentIndex(),
-            so goChangedCommand() reads the wrong button when user clicks a row.
-    After:  setCurrentIndex() is called to keep both in sync.
-    Fixes: https://github.com/FreeCAD/FreeCAD/issues/17812
-    """
-    filepath = find_file(source_dir, "DlgCustomizeSpaceball.cpp")
-    if not filepath:
-        print("  SKIP: DlgCustomizeSpaceball.cpp not found")
-        return False
-
-    with open(filepath) as f:
-        content = f.read()
-
-    if "this->setCurrentIndex(idx)" in content:
-        print(f"  OK:   {os.path.relpath(filepath, source_dir)} (already patched)")
-        return True
-
-    old = (
-        "void ButtonView::selectButton(int number)\n"
-        "{\n"
-        "    this->selectionModel()->select(this->model()->index(number, 0), QItemSelectionModel::ClearAndSelect);\n"
-        "    this->scrollTo(this->model()->index(number, 0), QAbstractItemView::EnsureVisible);\n"
-        "}"
-    )
-    new = (
-        "void ButtonView::selectButton(int number)\n"
-        "{\n"
-        "    QModelIndex idx = this->model()->index(number, 0);\n"
-        "    this->selectionModel()->select(idx, QItemSelectionModel::ClearAndSelect);\n"
-        "    this->setCurrentIndex(idx);\n"
-        "    this->scrollTo(idx, QAbstractItemView::EnsureVisible);\n"
-        "}"
-    )
-
-    if old not in content:
-        print(
-            f"  FAIL: Could not find selectButton pattern in {os.path.relpath(filepath, source_dir)}"
-        )
-        print("        The code may have changed in this FreeCAD version.")
-        return False
-
-    content = content.replace(old, new, 1)
-
-    with open(filepath, "w") as f:
-        f.write(content)
-
-    print(f"  DONE: {os.path.relpath(filepath, source_dir)} - Button selection sync applied")
-    return True
+SELECT_BUTTON_OLD = (
+    "void ButtonView::selectButton(int number)\n"
+    "{\n"
+    "    this->selectionModel()->select(this->model()->index(number, 0), QItemSelectionModel::ClearAndSelect);\n"
+    "    this->scrollTo(this->model()->index(number, 0), QAbstractItemView::EnsureVisible);\n"
+    "}"
+)
+SELECT_BUTTON_NEW = (
+    "void ButtonView::selectButton(int number)\n"
+    "{\n"
+    "    QModelIndex idx = this->model()->index(number, 0);\n"
+    "    this->selectionModel()->select(idx, QItemSelectionModel::ClearAndSelect);\n"
+    "    this->setCurrentIndex(idx);\n"
+    "    this->scrollTo(idx, QAbstractItemView::EnsureVisible);\n"
+    "}"
+)
+
+
+# Before: selectButton() updates the visual selection but not currentIndex(),
+#         so goChangedCommand() reads the wrong button when user clicks a row.
+# After:  setCurrentIndex() is called to keep both in sync.
+# Fixes: https://github.com/FreeCAD/FreeCAD/issues/17812
+BUTTON_SELECT_FIX = PatchSpec(
+    target="DlgCustomizeSpaceball.cpp",
+    old=SELECT_BUTTON_OLD,
+    new=SELECT_BUTTON_NEW,
+    patched_markers=("this->setCurrentIndex(idx)",),
+    done_msg="Button selection sync applied",
+    fail_what="selectButton pattern",
+)
 
 
 # ---------------------------------------------------------------------------
 # Fix 5: Checkable action invoke (#10073)
 # ---------------------------------------------------------------------------
-def patch_button_invoke(source_dir):
-    """Fix 5: Use invoke(1) for SpaceBall button commands.
-
-    Before: runCommandByName() calls invoke(0), which never satisfies
-            checkable action guards (if iMsg == 1), so commands like
-            Std_OrthographicCamera fail silently.
-    After:  getCommandByName() + invoke(1) in the two SpaceBall button
-            handlers (MainWindow.cpp for Linux/spnav, NavlibCmds.cpp for
-            Windows/macOS NavLib).
-    Fixes: https://github.com/FreeCAD/FreeCAD/issues/10073
-    """
-    ok_main = _patch_button_invoke_mainwindow(source_dir)
-    ok_navlib = _patch_button_invoke_navlib(source_dir)
-    return ok_main and ok_navlib
-
-
-def _patch_button_invoke_mainwindow(source_dir):
-    """Fix 5a: SpaceBall button handler in MainWindow.cpp (Linux/spnav)."""
-    filepath = find_file(source_dir, "MainWindow.cpp")
-    if not filepath:
-        print("  FAIL: MainWindow.cpp not found")
-        return False
-
-    with open(filepath) as f:
-        content = f.read()
-
-    # Check if already patched
-    if (
-        "cmd->invoke(1);" in content
-        and "getCommandByName(\n                    commandName" in content
-    ):
-        print(f"  OK:   {os.path.relpath(filepath, source_dir)} (already patched)")
-        return True
-
-    old = (
-        "            if (commandName.empty()) {\n"
-        "                return true;\n"
-        "            }\n"
-        "            else {\n"
-        "                Application::Instance->commandManager().runCommandByName(commandName.c_str());\n"
-        "            }"
-    )
-    new = (
-        "            if (commandName.empty()) {\n"
-        "                return true;\n"
-        "            }\n"
-        "            else {\n"
-        "                Command* cmd = Application::Instance->commandManager().getCommandByName(\n"
-        "                    commandName.c_str());\n"
-        "                if (cmd) {\n"
-        "                    cmd->invoke(1);\n"
-        "                }\n"
-        "            }"
-    )
-
-    if old not in content:
-        print(
-            f"  FAIL: Could not find SpaceBall button handler pattern in {os.path.relpath(filepath, source_dir)}"
-        )
-        print("        (looking for runCommandByName near commandName.empty())")
-        return False
-
-    content = content.replace(old, new, 1)
-
-    with open(filepath, "w") as f:
-        f.write(content)
-
-    print(f"  DONE: {os.path.relpath(filepath, source_dir)} - Button invoke(1) applied")
-    return True
-
-
-def _patch_button_invoke_navlib(source_dir):
-    """Fix 5b: SpaceBall button handler in NavlibCmds.cpp (Windows/macOS)."""
-    filepath = find_file(source_dir, "NavlibCmds.cpp")
-    if not filepath:
-        print("  SKIP: NavlibCmds.cpp not found (NavLib not available?)")
-        return True  # Not a failure — NavLib may not be present
-
-    with open(filepath) as f:
-        content = f.read()
-
-    # Check if already patched
-    if "cmd->invoke(1);" in content and "getCommandByName(parsedData.commandName" in content:
-        print(f"  OK:   {os.path.relpath(filepath, source_dir)} (already patched)")
-        return True
-
-    old = "    else\n        commandManager.runCommandByName(parsedData.commandName.c_str());"
-    new = (
-        "    else {\n"
-        "        Gui::Command* cmd = commandManager.getCommandByName(parsedData.commandName.c_str());\n"
-        "        if (cmd) {\n"
-        "            cmd->invoke(1);\n"
-        "        }\n"
-        "    }"
-    )
-
-    if old not in content:
-        print(
-            f"  FAIL: Could not find NavLib button handler pattern in {os.path.relpath(filepath, source_dir)}"
-        )
-        print("        (looking for commandManager.runCommandByName(parsedData.commandName))")
-        return False
-
-    content = content.replace(old, new, 1)
-
-    with open(filepath, "w") as f:
-        f.write(content)
-
-    print(f"  DONE: {os.path.relpath(filepath, source_dir)} - Button invoke(1) applied")
-    return True
+# Before: runCommandByName() calls invoke(0), which never satisfies
+#         checkable action guards (if iMsg == 1), so commands like
+#         Std_OrthographicCamera fail silently.
+# After:  getCommandByName() + invoke(1) in the two SpaceBall button
+#         handlers (MainWindow.cpp for Linux/spnav, NavlibCmds.cpp for
+#         Windows/macOS NavLib).
+# Fixes: https://github.com/FreeCAD/FreeCAD/issues/10073
+
+# Fix 5a: SpaceBall button handler in MainWindow.cpp (Linux/spnav)
+MAINWINDOW_INVOKE_OLD = (
+    "            if (commandName.empty()) {\n"
+    "                return true;\n"
+    "            }\n"
+    "            else {\n"
+    "                Application::Instance->commandManager().runCommandByName(commandName.c_str());\n"
+    "            }"
+)
+MAINWINDOW_INVOKE_NEW = (
+    "            if (commandName.empty()) {\n"
+    "                return true;\n"
+    "            }\n"
+    "            else {\n"
+    "                Command* cmd = Application::Instance->commandManager().getCommandByName(\n"
+    "                    commandName.c_str());\n"
+    "                if (cmd) {\n"
+    "                    cmd->invoke(1);\n"
+    "                }\n"
+    "            }"
+)
+
+
+BUTTON_INVOKE_MAINWINDOW_FIX = PatchSpec(
+    target="MainWindow.cpp",
+    old=MAINWINDOW_INVOKE_OLD,
+    new=MAINWINDOW_INVOKE_NEW,
+    patched_markers=("cmd->invoke(1);", "getCommandByName(\n                    commandName"),
+    done_msg="Button invoke(1) applied",
+    fail_what="SpaceBall button handler pattern",
+    fail_hint="(looking for runCommandByName near commandName.empty())",
+    missing_msg="FAIL: MainWindow.cpp not found",
+)
+
+# Fix 5b: SpaceBall button handler in NavlibCmds.cpp (Windows/macOS)
+NAVLIB_INVOKE_OLD = (
+    "    else\n        commandManager.runCommandByName(parsedData.commandName.c_str());"
+)
+NAVLIB_INVOKE_NEW = (
+    "    else {\n"
+    "        Gui::Command* cmd = commandManager.getCommandByName(parsedData.commandName.c_str());\n"
+    "        if (cmd) {\n"
+    "            cmd->invoke(1);\n"
+    "        }\n"
+    "    }"
+)
+
+
+BUTTON_INVOKE_NAVLIB_FIX = PatchSpec(
+    target="NavlibCmds.cpp",
+    old=NAVLIB_INVOKE_OLD,
+    new=NAVLIB_INVOKE_NEW,
+    patched_markers=("cmd->invoke(1);", "getCommandByName(parsedData.commandName"),
+    done_msg="Button invoke(1) applied",
+    fail_what="NavLib button handler pattern",
+    fail_hint="(looking for commandManager.runCommandByName(parsedData.commandName))",
+    missing_msg="SKIP: NavlibCmds.cpp not found (NavLib not available?)",
+    missing_ok=True,  # Not a failure — NavLib may not be present
+)
 
 
 # ---------------------------------------------------------------------------
 # Fix 6: spnav disconnect detection (#17809)
 # ---------------------------------------------------------------------------
-def patch_spnav_disconnect(source_dir):
+DISCONNECT_DTOR_OLD = (
+    "Gui::GuiNativeEvent::~GuiNativeEvent()\n"
+    "{\n"
+    "    if (spnav_close()) {\n"
+    '        Base::Console().log("Couldn\'t disconnect from spacenav daemon\\n");\n'
+    "    }\n"
+    "    else {\n"
+    '        Base::Console().log("Disconnected from spacenav daemon\\n");\n'
+    "    }\n"
+    "}"
+)
+DISCONNECT_DTOR_NEW = (
+    "Gui::GuiNativeEvent::~GuiNativeEvent()\n"
+    "{\n"
+    "    if (spnavNotifier) {\n"
+    "        if (spnav_close()) {\n"
+    '            Base::Console().log("Couldn\'t disconnect from spacenav daemon\\n");\n'
+    "        }\n"
+    "        else {\n"
+    '            Base::Console().log("Disconnected from spacenav daemon\\n");\n'
+    "        }\n"
+    "    }\n"
+    "}"
+)
+DISCONNECT_EOF_BLOCK = (
+    "\n"
+    "    if (!gotEvent) {\n"
+    "        // QSocketNotifier fired but no events were available.\n"
+    "        // Verify the connection is still alive using a non-consuming peek.\n"
+    "        int fd = spnav_fd();\n"
+    "        if (fd >= 0) {\n"
+    "            char buf;\n"
+    "            ssize_t ret = recv(fd, &buf, 1, MSG_PEEK | MSG_DONTWAIT);\n"
+    "            if (ret == 0 || (ret < 0 && errno != EAGAIN && errno != EWOULDBLOCK)) {\n"
+    "                // EOF or socket error — spacenavd disconnected\n"
+    "                Base::Console().warning(\n"
+    '                    "Lost connection to spacenav daemon. Restart FreeCAD to reconnect.\\n");\n'
+    "                spnavNotifier->setEnabled(false);\n"
+    "                spnav_close();\n"
+    "                spnavNotifier = nullptr;\n"
+    "            }\n"
+    "        }\n"
+    "    }\n"
+)
+DISCONNECT_END_OLD = (
+    "        mainApp->postMotionEvent(motionDataArray);\n"
+    "    }\n"
+    "}\n"
+    "\n"
+    '#include "3Dconnexion/moc_GuiNativeEventLinux.cpp"'
+)
+DISCONNECT_END_NEW = (
+    "        mainApp->postMotionEvent(motionDataArray);\n"
+    "    }\n" + DISCONNECT_EOF_BLOCK + "}\n"
+    "\n"
+    '#include "3Dconnexion/moc_GuiNativeEventLinux.cpp"'
+)
+
+
+def patch_spnav_disconnect(source_dir, buffers):
     """Fix 6: Detect spacenavd disconnection to prevent 100% CPU usage.
 
     Before: When spacenavd stops, QSocketNotifier fires continuously on
@@ -575,24 +772,20 @@ def patch_spnav_disconnect(source_dir):
     Requires: Fix 1 (event coalescing) must be applied first.
     Fixes: https://github.com/FreeCAD/FreeCAD/issues/17809
     """
-    cpp_path = find_file(source_dir, "GuiNativeEventLinux.cpp")
-    h_path = find_file(source_dir, "GuiNativeEventLinux.h")
-    if not cpp_path:
+    cpp_buf = buffers.get("GuiNativeEventLinux.cpp")
+    h_buf = buffers.get("GuiNativeEventLinux.h")
+    if not cpp_buf:
         print("  SKIP: GuiNativeEventLinux.cpp not found")
         return False
-    if not h_path:
+    if not h_buf:
         print("  SKIP: GuiNativeEventLinux.h not found")
         return False
 
-    with open(cpp_path) as f:
-        cpp = f.read()
-    with open(h_path) as f:
-        header = f.read()
+    cpp = cpp_buf.content
+    header = h_buf.content
 
     if "spnavNotifier" in cpp:
-        print(
-            f"  OK:   {os.path.relpath(cpp_path, source_dir)} (disconnect detection already patched)"
-        )
+        print(f"  OK:   {cpp_buf.rel} (disconnect detection already patched)")
         return True
 
     if "hasMotion" not in cpp:
@@ -624,9 +817,6 @@ def patch_spnav_disconnect(source_dir):
                 1,
             )
 
-    with open(h_path, "w") as f:
-        f.write(header)
-
     # --- Patch cpp ---
 
     # Add includes for recv/errno
@@ -648,39 +838,11 @@ def patch_spnav_disconnect(source_dir):
     cpp = cpp.replace("connect(SpacenavNotifier,", "connect(spnavNotifier,", 1)
 
     # Update destructor: only close if connection is active
-    old_dtor = (
-        "Gui::GuiNativeEvent::~GuiNativeEvent()\n"
-        "{\n"
-        "    if (spnav_close()) {\n"
-        '        Base::Console().log("Couldn\'t disconnect from spacenav daemon\\n");\n'
-        "    }\n"
-        "    else {\n"
-        '        Base::Console().log("Disconnected from spacenav daemon\\n");\n'
-        "    }\n"
-        "}"
-    )
-    new_dtor = (
-        "Gui::GuiNativeEvent::~GuiNativeEvent()\n"
-        "{\n"
-        "    if (spnavNotifier) {\n"
-        "        if (spnav_close()) {\n"
-        '            Base::Console().log("Couldn\'t disconnect from spacenav daemon\\n");\n'
-        "        }\n"
-        "        else {\n"
-        '            Base::Console().log("Disconnected from spacenav daemon\\n");\n'
-        "        }\n"
-        "    }\n"
-        "}"
-    )
-
-    if old_dtor not in cpp:
-        print(
-            f"  FAIL: Could not find destructor pattern in {os.path.relpath(cpp_path, source_dir)}"
-        )
+    cpp, found = replace_once(cpp, DISCONNECT_DTOR_OLD, DISCONNECT_DTOR_NEW)
+    if not found:
+        print(f"  FAIL: Could not find destructor pattern in {cpp_buf.rel}")
         return False
 
-    cpp = cpp.replace(old_dtor, new_dtor, 1)
-
     # Add 'bool gotEvent = false;' after 'bool hasMotion = false;'
     if "bool gotEvent = false;" not in cpp:
         cpp = cpp.replace(
@@ -698,133 +860,74 @@ def patch_spnav_disconnect(source_dir):
 
     # Add EOF detection block after the if(hasMotion) block, before the function-closing brace.
     # Anchor to the moc include to ensure we match the right closing brace.
-    eof_block = (
-        "\n"
-        "    if (!gotEvent) {\n"
-        "        // QSocketNotifier fired but no events were available.\n"
-        "        // Verify the connection is still alive using a non-consuming peek.\n"
-        "        int fd = spnav_fd();\n"
-        "        if (fd >= 0) {\n"
-        "            char buf;\n"
-        "            ssize_t ret = recv(fd, &buf, 1, MSG_PEEK | MSG_DONTWAIT);\n"
-        "            if (ret == 0 || (ret < 0 && errno != EAGAIN && errno != EWOULDBLOCK)) {\n"
-        "                // EOF or socket error — spacenavd disconnected\n"
-        "                Base::Console().warning(\n"
-        '                    "Lost connection to spacenav daemon. Restart FreeCAD to reconnect.\\n");\n'
-        "                spnavNotifier->setEnabled(false);\n"
-        "                spnav_close();\n"
-        "                spnavNotifier = nullptr;\n"
-        "            }\n"
-        "        }\n"
-        "    }\n"
-    )
-
-    old_end = (
-        "        mainApp->postMotionEvent(motionDataArray);\n"
-        "    }\n"
-        "}\n"
-        "\n"
-        '#include "3Dconnexion/moc_GuiNativeEventLinux.cpp"'
-    )
-    new_end = (
-        "        mainApp->postMotionEvent(motionDataArray);\n"
-        "    }\n" + eof_block + "}\n"
-        "\n"
-        '#include "3Dconnexion/moc_GuiNativeEventLinux.cpp"'
-    )
-
-    if old_end not in cpp:
-        print(
-            f"  FAIL: Could not find pollSpacenav end pattern for EOF block in {os.path.relpath(cpp_path, source_dir)}"
-        )
+    cpp, found = replace_once(cpp, DISCONNECT_END_OLD, DISCONNECT_END_NEW)
+    if not found:
+        print(f"  FAIL: Could not find pollSpacenav end pattern for EOF block in {cpp_buf.rel}")
         return False
 
-    cpp = cpp.replace(old_end, new_end, 1)
-
-    with open(cpp_path, "w") as f:
-        f.write(cpp)
+    # Header and .cpp are committed together (see PatchBuffer).
+    h_buf.update(header)
+    cpp_buf.update(cpp)
 
-    print(
-        f"  DONE: {os.path.relpath(cpp_path, source_dir)} + {os.path.relpath(h_path, source_dir)} - spnav disconnect detection applied"
-    )
+    print(f"  DONE: {cpp_buf.rel} + {h_buf.rel} - spnav disconnect detection applied")
     return True
 
 
 # ---------------------------------------------------------------------------
 # Fix 7: Spaceball button dialog reset (#19366)
 # ---------------------------------------------------------------------------
-def patch_spaceball_reset(source_dir):
-    """Fix 7: Fix Spaceball button dialog Reset not updating the view.
-
-    Before: loadConfig() calls goClear() (beginRemoveRows/endRemoveRows)
-            then load3DConnexionButtons() which writes new entries to
-            user.cfg without notifying the Qt model. The view keeps
-            showing the old button list until the dialog is reopened.
-    After:  loadConfig() uses beginResetModel/endResetModel to wrap the
-            entire clear+load operation, so the view updates immediately.
-    Fixes: https://github.com/FreeCAD/FreeCAD/issues/19366
-    """
-    cpp_path = find_file(source_dir, "DlgCustomizeSpaceball.cpp")
-    if not cpp_path:
-        print("  SKIP: DlgCustomizeSpaceball.cpp not found")
-        return False
-
-    with open(cpp_path) as f:
-        cpp = f.read()
-
-    if "beginResetModel" in cpp:
-        print(f"  OK:   {os.path.relpath(cpp_path, source_dir)} (reset fix already patched)")
-        return True
-
-    old_loadconfig = (
-        "void ButtonModel::loadConfig(const char* RequiredDeviceName)\n"
-        "{\n"
-        "    goClear();\n"
-        "    if (!RequiredDeviceName) {\n"
-        "        return;\n"
-        "    }\n"
-        "    load3DConnexionButtons(RequiredDeviceName);\n"
-        "}"
-    )
-
-    new_loadconfig = (
-        "void ButtonModel::loadConfig(const char* RequiredDeviceName)\n"
-        "{\n"
-        "    beginResetModel();\n"
-        "    spaceballButtonGroup()->Clear();\n"
-        "    if (RequiredDeviceName) {\n"
-        "        load3DConnexionButtons(RequiredDeviceName);\n"
-        "    }\n"
-        "    endResetModel();\n"
-        "}"
-    )
-
-    if old_loadconfig not in cpp:
-        print(
-            f"  FAIL: Could not find loadConfig pattern in {os.path.relpath(cpp_path, source_dir)}"
-        )
-        return False
-
-    cpp = cpp.replace(old_loadconfig, new_loadconfig, 1)
-
-    with open(cpp_path, "w") as f:
-        f.write(cpp)
-
-    print(f"  DONE: {os.path.relpath(cpp_path, source_dir)} - spaceball reset fix applied")
-    return True
+RESET_LOADCONFIG_OLD = (
+    "void ButtonModel::loadConfig(const char* RequiredDeviceName)\n"
+    "{\n"
+    "    goClear();\n"
+    "    if (!RequiredDeviceName) {\n"
+    "        return;\n"
+    "    }\n"
+    "    load3DConnexionButtons(RequiredDeviceName);\n"
+    "}"
+)
+RESET_LOADCONFIG_NEW = (
+    "void ButtonModel::loadConfig(const char* RequiredDeviceName)\n"
+    "{\n"
+    "    beginResetModel();\n"
+    "    spaceballButtonGroup()->Clear();\n"
+    "    if (RequiredDeviceName) {\n"
+    "        load3DConnexionButtons(RequiredDeviceName);\n"
+    "    }\n"
+    "    endResetModel();\n"
+    "}"
+)
+
+
+# Before: loadConfig() calls goClear() (beginRemoveRows/endRemoveRows)
+#         then load3DConnexionButtons() which writes new entries to
+#         user.cfg without notifying the Qt model. The view keeps
+#         showing the old button list until the dialog is reopened.
+# After:  loadConfig() uses beginResetModel/endResetModel to wrap the
+#         entire clear+load operation, so the view updates immediately.
+# Fixes: https://github.com/FreeCAD/FreeCAD/issues/19366
+SPACEBALL_RESET_FIX = PatchSpec(
+    target="DlgCustomizeSpaceball.cpp",
+    old=RESET_LOADCONFIG_OLD,
+    new=RESET_LOADCONFIG_NEW,
+    patched_markers=("beginResetModel",),
+    done_msg="spaceball reset fix applied",
+    fail_what="loadConfig pattern",
+    fail_hint=None,
+    already_msg="reset fix already patched",
+)
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 def main():
-    check_only = False
-    args = [a for a in sys.argv[1:] if a != "--check"]
-    if "--check" in sys.argv:
-        check_only = True
+    check_only = "--check" in sys.argv
+    diff_only = "--diff" in sys.argv
+    args = [a for a in sys.argv[1:] if a not in ("--check", "--diff")]
 
     if not args:
-        print(f"Usage: {sys.argv[0]} [--check] /path/to/freecad-source")
+        print(f"Usage: {sys.argv[0]} [--check | --diff] /path/to/freecad-source")
         print()
         print("Applies SpaceMouse fixes to FreeCAD source code:")
         print("  Fixes 1-3: Performance (event coalescing, camera batching, per-axis deadzone)")
@@ -833,6 +936,7 @@ def main():
         print("  Fix 7:     UI (spaceball reset button fix)")
         print()
         print("Use --check to verify if patches can be applied without modifying files.")
+        print("Use --diff to print the changes as a unified diff (for patch -p1) instead.")
         sys.exit(1)
 
     source_dir = args[0]
@@ -841,9 +945,30 @@ def main():
         print(f"Error: Directory not found: {source_dir}")
         sys.exit(1)
 
+    # A previous successful run left a sentinel with the stamps of every file
+    # it wrote. If none of them (nor this script) changed since, there is
+    # nothing to do and the tree scan and file reads can be skipped.
+    if not check_only and not diff_only and sentinel_is_current(source_dir):
+        print("Applying SpaceMouse fixes...")
+        print()
+        print(f"  OK:   no target file changed since the last run ({SENTINEL_NAME})")
+        print()
+        print("All patches applied successfully.")
+        sys.exit(0)
+
+    files = find_files(source_dir, TARGET_FILES)
+
+    # find_files() builds every path by joining onto source_dir, so stripping
+    # that prefix gives the same result as os.path.relpath() without
+    # re-normalizing both paths for every log line.
+    prefix = os.path.join(source_dir, "")
+
+    def rel_path(path):
+        return path.removeprefix(prefix)
+
     # Verify this looks like a FreeCAD source tree
-    nav_file = find_file(source_dir, "NavigationStyle.cpp")
-    spnav_file = find_file(source_dir, "GuiNativeEventLinux.cpp")
+    nav_file = files.get("NavigationStyle.cpp")
+    spnav_file = files.get("GuiNativeEventLinux.cpp")
 
     if not nav_file and not spnav_file:
         print("Error: This doesn't look like a FreeCAD source directory.")
@@ -855,86 +980,93 @@ def main():
         ok = True
 
         if spnav_file:
-            rel = os.path.relpath(spnav_file, source_dir)
-            with open(spnav_file) as f:
-                c = f.read()
+            rel = rel_path(spnav_file)
+            with map_source(spnav_file) as c:
+                has_motion = c.find(b"hasMotion") != -1
+                can_coalesce = c.find(b"mainApp->postMotionEvent(motionDataArray)") != -1
+                has_deadzone = c.find(b"DeadzoneCache") != -1
+                has_notifier = c.find(b"spnavNotifier") != -1
             # Fix 1: Event coalescing
-            if "hasMotion" in c:
+            if has_motion:
                 print(f"  OK: {rel} event coalescing already patched")
-            elif "mainApp->postMotionEvent(motionDataArray)" in c:
+            elif can_coalesce:
                 print(f"  OK: {rel} event coalescing can be patched")
             else:
                 print(f"  WARN: {rel} - event coalescing pattern not found")
                 ok = False
             # Fix 3: Per-axis deadzone
-            if "DeadzoneCache" in c:
+            if has_deadzone:
                 print(f"  OK: {rel} per-axis deadzone already patched")
-            elif "hasMotion" in c or "mainApp->postMotionEvent(motionDataArray)" in c:
+            elif has_motion or can_coalesce:
                 print(f"  OK: {rel} per-axis deadzone can be patched")
             else:
                 print(f"  WARN: {rel} - per-axis deadzone requires event coalescing first")
                 ok = False
             # Fix 6: Disconnect detection
-            if "spnavNotifier" in c:
+            if has_notifier:
                 print(f"  OK: {rel} disconnect detection already patched")
-            elif "hasMotion" in c or "mainApp->postMotionEvent(motionDataArray)" in c:
+            elif has_motion or can_coalesce:
                 print(f"  OK: {rel} disconnect detection can be patched")
             else:
                 print(f"  WARN: {rel} - disconnect detection requires event coalescing first")
                 ok = False
 
         if nav_file:
-            rel = os.path.relpath(nav_file, source_dir)
-            with open(nav_file) as f:
-                c = f.read()
+            rel = rel_path(nav_file)
+            with map_source(nav_file) as c:
+                batched = c.find(b"enableNotify(false)") != -1
+                can_batch = MOTION_CAMERA_BYTES_RE.search(c) is not None
             # Fix 2: Batched camera updates
-            if "enableNotify(false)" in c:
+            if batched:
                 print(f"  OK: {rel} batched camera updates already patched")
-            elif (
-                "camera->orientation.setValue(newRotation)" in c
-                and "camera->orientation.getValue().multVec(dir" in c
-            ):
+            elif can_batch:
                 print(f"  OK: {rel} batched camera updates can be patched")
             else:
                 print(f"  WARN: {rel} - batched camera updates pattern not found")
                 ok = False
 
         # Fix 4: Button select
-        btn_file = find_file(source_dir, "DlgCustomizeSpaceball.cpp")
+        btn_file = files.get("DlgCustomizeSpaceball.cpp")
         if btn_file:
-            rel = os.path.relpath(btn_file, source_dir)
-            with open(btn_file) as f:
-                c = f.read()
-            if "this->setCurrentIndex(idx)" in c:
+            rel = rel_path(btn_file)
+            with map_source(btn_file) as c:
+                patched = c.find(b"this->setCurrentIndex(idx)") != -1
+                patchable = c.find(b"void ButtonView::selectButton") != -1
+            if patched:
                 print(f"  OK: {rel} button selection sync already patched")
-            elif "void ButtonView::selectButton" in c:
+            elif patchable:
                 print(f"  OK: {rel} button selection sync can be patched")
             else:
                 print(f"  WARN: {rel} - selectButton pattern not found")
                 ok = False
 
         # Fix 5: Button invoke
-        mw_file = find_file(source_dir, "MainWindow.cpp")
+        mw_file = files.get("MainWindow.cpp")
         if mw_file:
-            rel = os.path.relpath(mw_file, source_dir)
-            with open(mw_file) as f:
-                c = f.read()
-            if "cmd->invoke(1);" in c and "getCommandByName" in c:
+            rel = rel_path(mw_file)
+            with map_source(mw_file) as c:
+                patched = c.find(b"cmd->invoke(1);") != -1 and c.find(b"getCommandByName") != -1
+                patchable = c.find(b"runCommandByName(commandName.c_str())") != -1
+            if patched:
                 print(f"  OK: {rel} button invoke already patched")
-            elif "runCommandByName(commandName.c_str())" in c:
+            elif patchable:
                 print(f"  OK: {rel} button invoke can be patched")
             else:
                 print(f"  WARN: {rel} - button invoke pattern not found")
                 ok = False
 
-        nl_file = find_file(source_dir, "NavlibCmds.cpp")
+        nl_file = files.get("NavlibCmds.cpp")
         if nl_file:
-            rel = os.path.relpath(nl_file, source_dir)
-            with open(nl_file) as f:
-                c = f.read()
-            if "cmd->invoke(1);" in c and "getCommandByName(parsedData" in c:
+            rel = rel_path(nl_file)
+            with map_source(nl_file) as c:
+                patched = (
+                    c.find(b"cmd->invoke(1);") != -1
+                    and c.find(b"getCommandByName(parsedData") != -1
+                )
+                patchable = c.find(b"runCommandByName(parsedData.commandName.c_str())") != -1
+            if patched:
                 print(f"  OK: {rel} NavLib button invoke already patched")
-            elif "runCommandByName(parsedData.commandName.c_str())" in c:
+            elif patchable:
                 print(f"  OK: {rel} NavLib button invoke can be patched")
             else:
                 print(f"  WARN: {rel} - NavLib button invoke pattern not found")
@@ -942,35 +1074,63 @@ def main():
 
         sys.exit(0 if ok else 1)
 
-    print("Applying SpaceMouse fixes...")
-    print()
+    # --diff writes a unified diff to stdout instead of touching the files;
+    # progress messages go to stderr so the diff can be redirected cleanly.
+    diff_out = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr if diff_only else sys.stdout):
+        print("Applying SpaceMouse fixes...")
+        print()
+
+        # The target files are independent, so read them (and later write them
+        # back) concurrently. The fixes themselves run in order below, which keeps
+        # the console output deterministic and Fix 1 -> 3 -> 6 sequential on
+        # their shared GuiNativeEventLinux.cpp buffer.
+        found = {name: path for name, path in files.items() if path}
+        with ThreadPoolExecutor() as pool:
+            buffers = dict(
+                zip(found, pool.map(PatchBuffer, found.values(), map(rel_path, found.values())))
+            )
+
+        print("--- Performance (PR #28110) ---")
+        ok1 = patch_poll_spacenav(source_dir, buffers)
+        ok2 = patch_process_motion_event(source_dir, buffers)
+        ok3 = patch_per_axis_deadzone(source_dir, buffers)
 
-    print("--- Performance (PR #28110) ---")
-    ok1 = patch_poll_spacenav(source_dir)
-    ok2 = patch_process_motion_event(source_dir)
-    ok3 = patch_per_axis_deadzone(source_dir)
+        print()
+        print("--- Button fixes (PR #28181) ---")
+        ok4 = apply_spec(source_dir, buffers, BUTTON_SELECT_FIX)
+        ok5 = all(
+            [
+                apply_spec(source_dir, buffers, BUTTON_INVOKE_MAINWINDOW_FIX),
+                apply_spec(source_dir, buffers, BUTTON_INVOKE_NAVLIB_FIX),
+            ]
+        )
 
-    print()
-    print("--- Button fixes (PR #28181) ---")
-    ok4 = patch_button_select(source_dir)
-    ok5 = patch_button_invoke(source_dir)
+        print()
+        print("--- Stability (#17809) ---")
+        ok6 = patch_spnav_disconnect(source_dir, buffers)
 
-    print()
-    print("--- Stability (#17809) ---")
-    ok6 = patch_spnav_disconnect(source_dir)
+        print()
+        print("--- UI fixes (#19366) ---")
+        ok7 = apply_spec(source_dir, buffers, SPACEBALL_RESET_FIX)
 
-    print()
-    print("--- UI fixes (#19366) ---")
-    ok7 = patch_spaceball_reset(source_dir)
+        if diff_only:
+            for buf in buffers.values():
+                diff_out.writelines(buf.diff())
+        else:
+            with ThreadPoolExecutor() as pool:
+                list(pool.map(PatchBuffer.flush, buffers.values()))
+            if all([ok1, ok2, ok3, ok4, ok5, ok6, ok7]):
+                write_sentinel(source_dir, buffers)
 
-    print()
-    results = [ok1, ok2, ok3, ok4, ok5, ok6, ok7]
-    if all(results):
-        print("All patches applied successfully.")
-        sys.exit(0)
-    else:
-        print("Some patches failed. See errors above.")
-        sys.exit(1)
+        print()
+        results = [ok1, ok2, ok3, ok4, ok5, ok6, ok7]
+        if all(results):
+            print("All patches applied successfully.")
+            sys.exit(0)
+        else:
+            print("Some patches failed. See errors above.")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -13,30 +13,85 @@ import bpy
 
 CONFIG = os.path.expanduser("~/.config/spacemouse/blender-ndof.json")
 
+# (key, value) pairs to apply and the config mtime they were built from, so an
+# unchanged file is neither re-parsed nor re-validated.
+_cached_mtime_ns = None
+_cached_settings = ()
+
+# Writable property names of PreferencesInput, looked up once from RNA.
+_writable_prop_names = None
+
+
+def _writable_props(prefs):
+    """Return the names of the writable RNA properties of the input preferences."""
+    global _writable_prop_names
+    if _writable_prop_names is None:
+        _writable_prop_names = frozenset(
+            p.identifier for p in prefs.bl_rna.properties if not p.is_readonly
+        )
+    return _writable_prop_names
+
+
+def _load_settings(prefs):
+    """Return the blender-ndof.json entries that map to writable preferences.
+
+    The file is validated once per change: non-object JSON and keys that are
+    not writable properties are dropped, leaving a tuple of (key, value) pairs.
+    Returns None if the file is missing or invalid.
+    """
+    global _cached_mtime_ns, _cached_settings
+    try:
+        mtime_ns = os.stat(CONFIG).st_mtime_ns
+    except OSError:
+        return None
+    if mtime_ns != _cached_mtime_ns:
+        try:
+            with open(CONFIG, "rb") as f:
+                cfg = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cfg, dict):
+            return None
+        writable = _writable_props(prefs)
+        _cached_settings = tuple((k, v) for k, v in cfg.items() if k in writable)
+        _cached_mtime_ns = mtime_ns
+    return _cached_settings
+
 
 def sync_ndof_settings():
     """Read blender-ndof.json and apply to bpy.context.preferences.inputs."""
-    if not os.path.exists(CONFIG):
-        return
-    try:
-        with open(CONFIG) as f:
-            cfg = json.load(f)
-    except (OSError, json.JSONDecodeError):
+    prefs = bpy.context.preferences.inputs
+    settings = _load_settings(prefs)
+    if settings is None:
         return
 
-    prefs = bpy.context.preferences.inputs
-    for key, value in cfg.items():
-        if hasattr(prefs, key):
-            try:
-                setattr(prefs, key, value)
-            except (TypeError, AttributeError):
-                pass
+    for key, value in settings:
+        try:
+            setattr(prefs, key, value)
+        except (TypeError, AttributeError):
+            pass
+
+
+# Retry interval and limit while bpy.context is not ready yet (~2 s in total).
+_RETRY_INTERVAL = 0.05
+_MAX_ATTEMPTS = 40
+_attempts = 0
 
 
 def _deferred_sync():
-    """Deferred sync — bpy.context is not ready at import time."""
+    """Deferred sync — bpy.context is not ready at import time.
+
+    Fires on the first main-loop iteration and re-schedules itself briefly
+    until the input preferences are reachable, instead of waiting a fixed 1 s.
+    """
+    global _attempts
+    _attempts += 1
+    try:
+        bpy.context.preferences.inputs  # noqa: B018
+    except AttributeError:
+        return _RETRY_INTERVAL if _attempts < _MAX_ATTEMPTS else None
     sync_ndof_settings()
     return None  # Don't repeat
 
 
-bpy.app.timers.register(_deferred_sync, first_interval=1.0, persistent=False)
+bpy.app.timers.register(_deferred_sync, first_interval=0.0, persistent=False)
@@ -1,7 +1,6 @@
 """Application entrypoint — tray, signal handling, profile coordination."""
 
 import atexit
-import json
 import os
 import shutil
 import signal
@@ -10,20 +9,25 @@ import sys
 import tempfile
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QProcess, Qt, QTimer
 from PySide6.QtGui import QAction, QColor, QIcon, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QApplication, QMenu, QMessageBox, QSystemTrayIcon
 
-from .constants import CONFIG_DIR, CONFIG_PATH, DARK_THEME
+from .config_store import load_config, serialize_config, write_config
+from .constants import CONFIG_PATH, DARK_THEME
+from .daemon_client import DaemonClient
 from .helpers import (
     create_tray_icon_pixmap,
-    send_daemon_cmd,
     set_spacemouse_led,
     wait_for_daemon_socket,
 )
-from .monitors import SpnavReader, make_window_monitor
+from .monitors import SpnavReader, load_libspnav, make_window_monitor
 from .settings_window import SettingsWindow
 
+# Quiet period after the last settings edit before config.json is written
+# and the daemon told to RELOAD.
+SAVE_DEBOUNCE_MS = 150
+
 
 class SpaceMouseApp:
     def __init__(self):
@@ -52,6 +56,9 @@ class SpaceMouseApp:
         self.app.setStyleSheet(theme)
 
         self.config = self._load_config()
+        profiles = self.config.get("profiles", {})
+        self._profiles_blob = serialize_config(profiles)
+        self._passthrough_profiles = self._find_passthrough_profiles(profiles)
         self._cleaned_up = False
 
         settings = self.config.get("settings", {})
@@ -59,29 +66,30 @@ class SpaceMouseApp:
         self._bg_test_enabled = settings.get("bg_test", False)
         self._bg_test_proc = None
         self._paused = settings.get("disabled", False)
-        # Initialise before SettingsWindow construction. _on_save reads
-        # self.window_monitor and the settings-window ctor wires the
-        # desktop_page.changed → _save_desktop → _on_save cascade; if
-        # anything fires that signal before _start_window_monitor() runs
-        # we must still respond with a defined attribute. Paired with the
-        # blockSignals() guard around sync_settings() in
-        # settings_window.SettingsWindow.sync_settings — they protect
-        # different stretches of the startup sequence (this one for any
-        # desktop_page edit during ctor; the other for the programmatic
-        # autostart/bg_test/actions setChecked() calls right after).
+        # Initialise before anything can reach _on_save: it reads
+        # self.window_monitor, and the settings window (built lazily in
+        # _ensure_settings_window) wires the desktop_page.changed →
+        # _save_desktop → _on_save cascade. Paired with the blockSignals()
+        # guard around sync_settings() in
+        # settings_window.SettingsWindow.sync_settings.
         self.window_monitor = None
-
-        self.settings_window = SettingsWindow(
-            self.config,
-            self._on_save,
-            on_bg_test_change=self._on_bg_test_change,
-            on_actions_change=self._on_actions_change,
-        )
-        self.settings_window.sync_settings(self._settings_snapshot())
-
-        # System tray
+        # Desktop-page widgets save on every change; _on_save restarts this
+        # timer so a burst of edits costs one write + RELOAD.
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._apply_saved_config)
+
+        # Built on first _show_settings; most sessions never open it, so
+        # the widget tree and its stylesheet work stay off the startup path.
+        self.settings_window = None
+        self._spnav_available = True
+
+        # System tray. Both states' icons are built once; pause toggles
+        # just swap them.
+        self._icon_active = QIcon(create_tray_icon_pixmap("SM"))
+        self._icon_paused = QIcon(create_tray_icon_pixmap("||"))
         self.tray = QSystemTrayIcon()
-        self.tray.setIcon(QIcon(create_tray_icon_pixmap("SM")))
+        self.tray.setIcon(self._icon_active)
         self.tray.setToolTip("SpaceMouse: default")
         self.tray.activated.connect(self._on_tray_activated)
 
@@ -119,8 +127,12 @@ class SpaceMouseApp:
         # so both can coexist without conflict.
         self.spnav_reader = SpnavReader()
         self.spnav_reader.set_suspended(True)
-        self.settings_window.set_spnav_reader(self.spnav_reader)
-        self.spnav_reader.start()
+        if load_libspnav() is None:
+            # No point starting a thread that would exit at once and
+            # leave the preview looking alive.
+            self._spnav_available = False
+        else:
+            self.spnav_reader.start()
 
         # Ensure the daemon is running. Quit from the tray stops the service,
         # so a fresh GUI launch needs to bring it back — otherwise PROFILE
@@ -136,16 +148,16 @@ class SpaceMouseApp:
             timeout=5,
         )
         wait_for_daemon_socket()
-        # Pull device info as soon as the daemon is reachable so the
-        # button-rows / live-bar reflect the actual hardware on first
-        # open. The 2s status timer keeps it in sync after hot-plug.
-        self.settings_window.refresh_device_info()
+        # PROFILE/RELOAD go out from a worker thread so a stalled daemon
+        # never blocks the tray or a focus change.
+        self._daemon = DaemonClient()
+        self._daemon.start()
 
         if self._paused:
-            send_daemon_cmd("PROFILE _passthrough")
+            self._daemon.post("PROFILE _passthrough")
             set_spacemouse_led(False)
             self.tray.setToolTip("SpaceMouse: DISABLED")
-            self.tray.setIcon(QIcon(create_tray_icon_pixmap("||")))
+            self.tray.setIcon(self._icon_paused)
 
         # Profile switching follows window focus and pause state:
         # - Disabled         → daemon stays on _passthrough regardless
@@ -154,10 +166,6 @@ class SpaceMouseApp:
         # - GUI focus        → daemon switches to _passthrough (no actions while editing)
         self._saved_profile = "default"
         self._gui_has_focus = False
-        self.settings_window.window_shown.connect(self._on_gui_shown)
-        self.settings_window.window_hidden.connect(self._on_gui_hidden)
-        self.settings_window.window_focused.connect(self._on_gui_focused)
-        self.settings_window.window_unfocused.connect(self._on_gui_unfocused)
 
         # Window monitor (also needed when disabled for LED control)
         self._start_window_monitor()
@@ -200,20 +208,31 @@ class SpaceMouseApp:
                 "the app stays reachable. The background daemon works "
                 "regardless.",
             )
+            self._flush_pending_save()
             settings["tray_warning_shown"] = True
-            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(self.config, f, indent=2)
+            self._write_config()
 
         self._show_settings()
 
+    def _write_config(self):
+        """Persist self.config; return False when the bytes on disk already match.
+
+        Every toggle in the settings window funnels through here, so an
+        unchanged config must not cost a rewrite (or a daemon RELOAD).
+        """
+        blob = serialize_config(self.config)
+        if blob == self._last_config_bytes:
+            return False
+        write_config(CONFIG_PATH, blob)
+        self._last_config_bytes = blob
+        return True
+
     def _load_config(self):
-        if CONFIG_PATH.exists():
-            try:
-                with open(CONFIG_PATH) as f:
-                    return json.load(f)
-            except (OSError, json.JSONDecodeError):
-                pass
+        config = load_config(CONFIG_PATH)
+        if config is not None:
+            self._last_config_bytes = serialize_config(config)
+            return config
+        self._last_config_bytes = None
         return {
             "profiles": {
                 "default": {
@@ -241,9 +260,11 @@ class SpaceMouseApp:
         if self._cleaned_up:
             return
         self._cleaned_up = True
+        self._flush_pending_save()
         self.spnav_reader.stop()
         self._stop_window_monitor()
         self._stop_bg_test_proc()
+        self._daemon.stop()
 
     def _on_bg_test_change(self, enabled):
         # Persist the sidebar "Smooth 3D nav" toggle to config.json without
@@ -252,10 +273,9 @@ class SpaceMouseApp:
         if enabled == self._bg_test_enabled:
             return
         self._bg_test_enabled = enabled
+        self._flush_pending_save()
         self.config.setdefault("settings", {})["bg_test"] = enabled
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_PATH, "w") as f:
-            json.dump(self.config, f, indent=2)
+        self._write_config()
         self._apply_bg_test_state()
 
     def _apply_bg_test_state(self):
@@ -347,33 +367,45 @@ class SpaceMouseApp:
 
     def _on_save(self, config):
         self.config = config
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_PATH, "w") as f:
-            json.dump(config, f, indent=2)
-
-        send_daemon_cmd("RELOAD")
+        self._save_timer.start(SAVE_DEBOUNCE_MS)
+
+    def _flush_pending_save(self):
+        """Apply a debounced save now, before another writer touches the file.
+
+        Keeps the daemon RELOAD in step with the write that actually puts
+        the pending profiles on disk, and makes quitting lose no edits.
+        """
+        if self._save_timer.isActive():
+            self._apply_saved_config()
+
+    def _apply_saved_config(self):
+        self._save_timer.stop()
+        config = self.config
+        self._write_config()
+
+        # The daemon only reads "profiles" (src/config.c) and the window
+        # monitor only matches on them, so GUI-only "settings" edits need
+        # neither a RELOAD nor a matcher rebuild.
+        profiles = config.get("profiles", {})
+        profiles_blob = serialize_config(profiles)
+        if profiles_blob != self._profiles_blob:
+            self._profiles_blob = profiles_blob
+            self._passthrough_profiles = self._find_passthrough_profiles(profiles)
+            self._daemon.post("RELOAD")
+            if self.window_monitor:
+                self.window_monitor.update_profiles(profiles)
 
         settings = config.get("settings", {})
         new_autostart = settings.get("autostart", self._autostart)
         if new_autostart != self._autostart:
             self._autostart = new_autostart
             action = "enable" if new_autostart else "disable"
-            subprocess.run(
-                ["systemctl", "--user", action, "spacemouse-config.service"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=5,
+            # One systemctl call for both units, detached: nothing here
+            # depends on its result, so the event loop need not wait.
+            QProcess.startDetached(
+                "systemctl",
+                ["--user", action, "spacemouse-config.service", "spacemouse-desktop.service"],
             )
-            subprocess.run(
-                ["systemctl", "--user", action, "spacemouse-desktop.service"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=5,
-            )
-
-        if self.window_monitor:
-            profiles = config.get("profiles", {})
-            self.window_monitor.update_profiles(profiles)
 
         self._update_tray_menu()
 
@@ -399,26 +431,36 @@ class SpaceMouseApp:
             self.window_monitor = None
 
     def _switch_profile(self, name):
-        send_daemon_cmd(f"PROFILE {name}")
+        self._daemon.post(f"PROFILE {name}")
         self.tray.setToolTip(f"SpaceMouse: {name}")
-        self.settings_window.set_profile_name(name)
+        if self.settings_window is not None:
+            self.settings_window.set_profile_name(name)
+
+    @staticmethod
+    def _find_passthrough_profiles(profiles):
+        """Names of profiles with all axes and buttons set to none (3D app passthrough)."""
+        names = set()
+        for name, prof in profiles.items():
+            am = prof.get("axis_mapping", {})
+            bm = prof.get("button_mapping", {})
+            if (
+                am
+                and all(v == "none" for v in am.values())
+                and all(v == "none" for v in bm.values())
+            ):
+                names.add(name)
+        return frozenset(names)
 
     def _is_passthrough_profile(self, profile_name):
-        """Check if a profile has all axes and buttons set to none (3D app passthrough)."""
-        profiles = self.config.get("profiles", {})
-        prof = profiles.get(profile_name, {})
-        am = prof.get("axis_mapping", {})
-        bm = prof.get("button_mapping", {})
-        if not am:
-            return False
-        return all(v == "none" for v in am.values()) and all(v == "none" for v in bm.values())
+        # Precomputed whenever the profiles change, so a focus change is a
+        # set lookup rather than a walk over the profile's mappings.
+        return profile_name in self._passthrough_profiles
 
     def _save_disabled_state(self):
         """Persist disabled state to config.json."""
+        self._flush_pending_save()
         self.config.setdefault("settings", {})["disabled"] = self._paused
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_PATH, "w") as f:
-            json.dump(self.config, f, indent=2)
+        self._write_config()
 
     def _settings_snapshot(self):
         # Single source of truth for the values the SettingsWindow mirrors:
@@ -445,48 +487,75 @@ class SpaceMouseApp:
         if paused:
             # Disable: daemon to passthrough (still drains events, but no actions).
             # 3D apps (Blender/FreeCAD) keep working via their own libspnav path.
-            send_daemon_cmd("PROFILE _passthrough")
+            self._daemon.post("PROFILE _passthrough")
             set_spacemouse_led(False)
             self.tray.setToolTip("SpaceMouse: DISABLED")
-            self.tray.setIcon(QIcon(create_tray_icon_pixmap("||")))
+            self.tray.setIcon(self._icon_paused)
         else:
             # Enable: restore daemon to whatever the current focus dictates.
             target = "_passthrough" if self._gui_has_focus else self._saved_profile
-            send_daemon_cmd(f"PROFILE {target}")
+            self._daemon.post(f"PROFILE {target}")
             set_spacemouse_led(True)
             self.tray.setToolTip(f"SpaceMouse: {self._saved_profile}")
-            self.tray.setIcon(QIcon(create_tray_icon_pixmap("SM")))
+            self.tray.setIcon(self._icon_active)
         self._save_disabled_state()
         self._update_tray_menu()
         # Keep the sidebar toggle in sync when state was changed from the
         # tray menu. sync_settings → setChecked re-emits stateChanged, but
         # _set_paused early-returns on no-change so no loop.
-        self.settings_window.sync_settings(self._settings_snapshot())
+        if self.settings_window is not None:
+            self.settings_window.sync_settings(self._settings_snapshot())
 
     def _on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
             self._show_settings()
 
+    def _ensure_settings_window(self):
+        if self.settings_window is not None:
+            return self.settings_window
+        window = SettingsWindow(
+            self.config,
+            self._on_save,
+            on_bg_test_change=self._on_bg_test_change,
+            on_actions_change=self._on_actions_change,
+        )
+        window.set_spnav_reader(self.spnav_reader)
+        if not self._spnav_available:
+            window.live_bar.set_preview_available(False)
+        window.set_profile_name(self._saved_profile)
+        # Pull device info now so the button-rows / live-bar reflect the
+        # actual hardware on first open. The status timer keeps it in
+        # sync after hot-plug.
+        window.refresh_device_info()
+        window.window_shown.connect(self._on_gui_shown)
+        window.window_hidden.connect(self._on_gui_hidden)
+        window.window_focused.connect(self._on_gui_focused)
+        window.window_unfocused.connect(self._on_gui_unfocused)
+        self.settings_window = window
+        return window
+
     def _show_settings(self):
-        self.settings_window.sync_settings(self._settings_snapshot())
+        window = self._ensure_settings_window()
+        window.sync_settings(self._settings_snapshot())
         # Clear any minimised state — on Wayland the window can come back
         # invisible after a previous close+show cycle if WindowMinimized was
         # left set, since the compositor decides where to put it.
-        state = self.settings_window.windowState()
+        state = window.windowState()
         if state & Qt.WindowState.WindowMinimized:
-            self.settings_window.setWindowState(state & ~Qt.WindowState.WindowMinimized)
-        self.settings_window.show()
-        self.settings_window.raise_()
-        self.settings_window.activateWindow()
+            window.setWindowState(state & ~Qt.WindowState.WindowMinimized)
+        window.show()
+        window.raise_()
+        window.activateWindow()
         # Wayland blocks programmatic focus; request activation via the
         # window handle so xdg-activation kicks in where supported.
-        handle = self.settings_window.windowHandle()
+        handle = window.windowHandle()
         if handle is not None:
             handle.requestActivate()
 
     def _on_window_changed(self, wm_class, profile_name):
         self._saved_profile = profile_name
-        self.settings_window.set_profile_name(profile_name)
+        if self.settings_window is not None:
+            self.settings_window.set_profile_name(profile_name)
 
         is_3d_app = self._is_passthrough_profile(profile_name)
 
@@ -505,7 +574,7 @@ class SpaceMouseApp:
                 f"SpaceMouse: DISABLED ({wm_class})" if is_3d_app else "SpaceMouse: DISABLED"
             )
         else:
-            send_daemon_cmd(f"PROFILE {profile_name}")
+            self._daemon.post(f"PROFILE {profile_name}")
             set_spacemouse_led(True)
             self.tray.setToolTip(f"SpaceMouse: {profile_name} ({wm_class})")
 
@@ -514,24 +583,22 @@ class SpaceMouseApp:
     def _on_gui_shown(self):
         """GUI window shown — take spnav for live preview, daemon to passthrough."""
         self._gui_has_focus = True
-        send_daemon_cmd("PROFILE _passthrough")
+        self._daemon.post("PROFILE _passthrough")
         self.spnav_reader.set_suspended(False)
-        self.settings_window._status_timer.start(3000)
         self._apply_bg_test_state()
 
     def _on_gui_hidden(self):
         """GUI window hidden — release spnav, restore daemon profile if enabled."""
         self._gui_has_focus = False
         self.spnav_reader.set_suspended(True)
-        self.settings_window._status_timer.stop()
         if not self._paused:
-            send_daemon_cmd(f"PROFILE {self._saved_profile}")
+            self._daemon.post(f"PROFILE {self._saved_profile}")
         self._apply_bg_test_state()
 
     def _on_gui_focused(self):
         """GUI got activation — take spnav for live preview, daemon to passthrough."""
         self._gui_has_focus = True
-        send_daemon_cmd("PROFILE _passthrough")
+        self._daemon.post("PROFILE _passthrough")
         self.spnav_reader.set_suspended(False)
         self._apply_bg_test_state()
 
@@ -542,20 +609,20 @@ class SpaceMouseApp:
         same profile name as before, leaving the daemon stuck on _passthrough."""
         self._gui_has_focus = False
         if not self._paused:
-            send_daemon_cmd(f"PROFILE {self._saved_profile}")
+            self._daemon.post(f"PROFILE {self._saved_profile}")
         self._apply_bg_test_state()
 
     def _quit(self):
         self._cleanup()
         set_spacemouse_led(False)
-        subprocess.run(
-            ["systemctl", "--user", "stop", "spacemouse-desktop.service"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            timeout=5,
-        )
         self.tray.hide()
-        self.app.quit()
+        # Stop the daemon without blocking the event loop; quit once
+        # systemctl finishes, fails to start, or after 5 s at the latest.
+        self._stop_proc = QProcess(self.app)
+        self._stop_proc.finished.connect(self.app.quit)
+        self._stop_proc.errorOccurred.connect(self.app.quit)
+        self._stop_proc.start("systemctl", ["--user", "stop", "spacemouse-desktop.service"])
+        QTimer.singleShot(5000, self.app.quit)
 
     def run(self):
         return self.app.exec()
@@ -2,8 +2,8 @@
 
 import filecmp
 import json
+import os
 import shutil
-import subprocess
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -24,11 +24,15 @@ class FreeCADConfig:
         Path.home() / ".FreeCAD",
         Path.home() / ".local" / "share" / "FreeCAD",
     ]
+    _PROC_DIR = "/proc"
 
     def __init__(self):
         self.path = None
         self._prev_path_index = 0  # so we can revert if the user cancels
         self._path_list = []
+        # (path, mtime_ns, size) of the user.cfg last parsed by read(), and
+        # the settings dict it produced.
+        self._read_cache = None
 
         for c in self._CANDIDATES:
             # FreeCAD keeps user.cfg at the config root (<dir>/user.cfg) and typically one level
@@ -47,85 +51,106 @@ class FreeCADConfig:
     def is_available(self):
         return self.path is not None
 
-    @staticmethod
-    def is_running():
+    @classmethod
+    def is_running(cls):
+        # Same match as `pgrep -xi FreeCAD` (exact, case-insensitive process
+        # name), read straight from /proc: the FreeCAD page polls this, and
+        # a directory scan is far cheaper than forking pgrep each time.
         try:
-            result = subprocess.run(["pgrep", "-xi", "FreeCAD"], capture_output=True, timeout=2)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pids = [e for e in os.listdir(cls._PROC_DIR) if e.isdigit()]
+        except OSError:
             return False
-
-    # XML helpers (same logic as freecad-spacemouse-patch.sh)
+        for pid in pids:
+            try:
+                with open(os.path.join(cls._PROC_DIR, pid, "comm"), "rb") as f:
+                    if f.read().strip().lower() == b"freecad":
+                        return True
+            except OSError:
+                continue  # process exited mid-scan
+        return False
+
+    # XML helpers (same logic as freecad-spacemouse-patch.sh). Lookups go
+    # through a per-parent index built in one pass, so reading or writing
+    # the ~20 Motion entries does not rescan the group once per entry.
     @staticmethod
-    def _find_group(parent, name):
+    def _index(parent):
+        """Map ``(tag, Name)`` to the first matching child of *parent*."""
+        idx = {}
         for child in parent:
-            if child.tag == "FCParamGroup" and child.get("Name") == name:
-                return child
-        return None
+            idx.setdefault((child.tag, child.get("Name")), child)
+        return idx
 
     @staticmethod
-    def _ensure_group(parent, name):
-        grp = FreeCADConfig._find_group(parent, name)
+    def _find_group(idx, name):
+        return idx.get(("FCParamGroup", name))
+
+    @staticmethod
+    def _add(parent, idx, tag, name, **attrib):
+        elem = ET.SubElement(parent, tag, Name=name, **attrib)
+        idx[(tag, name)] = elem
+        return elem
+
+    @staticmethod
+    def _ensure_group(parent, idx, name):
+        grp = idx.get(("FCParamGroup", name))
         if grp is not None:
             return grp
-        return ET.SubElement(parent, "FCParamGroup", Name=name)
+        return FreeCADConfig._add(parent, idx, "FCParamGroup", name)
 
     @staticmethod
-    def _get_bool(parent, name, default=False):
-        for child in parent:
-            if child.tag == "FCBool" and child.get("Name") == name:
-                return child.get("Value") == "1"
-        return default
+    def _get_bool(idx, name, default=False):
+        child = idx.get(("FCBool", name))
+        if child is None:
+            return default
+        return child.get("Value") == "1"
 
     @staticmethod
-    def _get_int(parent, name, default=0):
-        for child in parent:
-            if child.tag == "FCInt" and child.get("Name") == name:
-                try:
-                    return int(child.get("Value"))
-                except (TypeError, ValueError):
-                    return default
-        return default
+    def _get_int(idx, name, default=0):
+        child = idx.get(("FCInt", name))
+        if child is None:
+            return default
+        try:
+            return int(child.get("Value"))
+        except (TypeError, ValueError):
+            return default
 
     @staticmethod
-    def _get_text(parent, name, default=""):
-        for child in parent:
-            if child.tag == "FCText" and child.get("Name") == name:
-                val = child.get("Value")
-                if val is not None:
-                    return val
-                return (child.text or "").strip()
-        return default
+    def _get_text(idx, name, default=""):
+        child = idx.get(("FCText", name))
+        if child is None:
+            return default
+        val = child.get("Value")
+        if val is not None:
+            return val
+        return (child.text or "").strip()
 
     @staticmethod
-    def _set_bool(parent, name, value):
+    def _set_bool(parent, idx, name, value):
         val_str = "1" if value else "0"
-        for child in parent:
-            if child.tag == "FCBool" and child.get("Name") == name:
-                child.set("Value", val_str)
-                return
-        ET.SubElement(parent, "FCBool", Name=name, Value=val_str)
+        child = idx.get(("FCBool", name))
+        if child is not None:
+            child.set("Value", val_str)
+        else:
+            FreeCADConfig._add(parent, idx, "FCBool", name, Value=val_str)
 
     @staticmethod
-    def _set_int(parent, name, value):
+    def _set_int(parent, idx, name, value):
         val_str = str(value)
-        for child in parent:
-            if child.tag == "FCInt" and child.get("Name") == name:
-                child.set("Value", val_str)
-                return
-        ET.SubElement(parent, "FCInt", Name=name, Value=val_str)
+        child = idx.get(("FCInt", name))
+        if child is not None:
+            child.set("Value", val_str)
+        else:
+            FreeCADConfig._add(parent, idx, "FCInt", name, Value=val_str)
 
     @staticmethod
-    def _set_text(parent, name, value):
-        for child in parent:
-            if child.tag == "FCText" and child.get("Name") == name:
-                if child.get("Value") is not None:
-                    child.set("Value", value)
-                else:
-                    child.text = value
-                return
-        elem = ET.SubElement(parent, "FCText", Name=name)
-        elem.text = value
+    def _set_text(parent, idx, name, value):
+        child = idx.get(("FCText", name))
+        if child is None:
+            FreeCADConfig._add(parent, idx, "FCText", name).text = value
+        elif child.get("Value") is not None:
+            child.set("Value", value)
+        else:
+            child.text = value
 
     def read(self):
         """Read SpaceMouse-related settings from user.cfg. Returns dict."""
@@ -159,62 +184,73 @@ class FreeCADConfig:
         if not self.path:
             return defaults
 
+        # user.cfg holds every FreeCAD preference and is rewritten only on
+        # FreeCAD exit or by write(), so reuse the last parse while the
+        # file is unchanged.
+        st = os.stat(self.path)
+        key = (str(self.path), st.st_mtime_ns, st.st_size)
+        if self._read_cache is not None and self._read_cache[0] == key:
+            return dict(self._read_cache[1])
+
         try:
             tree = ET.parse(self.path)
         except ET.ParseError:
             return defaults
 
-        xml_root = tree.getroot()
-        fc_root = self._find_group(xml_root, "Root")
+        result = self._parse_settings(tree, defaults)
+        self._read_cache = (key, result)
+        return dict(result)
+
+    def _parse_settings(self, tree, defaults):
+        find, index = self._find_group, self._index
+        fc_root = find(index(tree.getroot()), "Root")
         if fc_root is None:
             return defaults
-        base_app = self._find_group(fc_root, "BaseApp")
+        base_app = find(index(fc_root), "BaseApp")
         if base_app is None:
             return defaults
+        base_idx = index(base_app)
 
         # Spaceball settings (BaseApp/Spaceball/Motion)
-        spaceball = self._find_group(base_app, "Spaceball")
+        spaceball = find(base_idx, "Spaceball")
         if spaceball is None:
             return defaults
-        motion = self._find_group(spaceball, "Motion")
+        spaceball_idx = index(spaceball)
+        motion = find(spaceball_idx, "Motion")
 
         result = dict(defaults)
         if motion is not None:
-            result["global_sensitivity"] = self._get_int(motion, "GlobalSensitivity", -15)
-            result["flip_yz"] = self._get_bool(motion, "FlipYZ", True)
-            result["dominant"] = self._get_bool(motion, "Dominant", False)
+            m = index(motion)
+            result["global_sensitivity"] = self._get_int(m, "GlobalSensitivity", -15)
+            result["flip_yz"] = self._get_bool(m, "FlipYZ", True)
+            result["dominant"] = self._get_bool(m, "Dominant", False)
             for axis in ["PanLR", "PanUD", "Zoom", "Tilt", "Roll", "Spin"]:
-                key_en = f"{axis.lower()}_enable"
-                key_rev = f"{axis.lower()}_reverse"
-                # Normalize: PanLR -> panlr, PanUD -> panud
-                key_en = axis[0].lower() + axis[1:].lower() + "_enable"
-                key_rev = axis[0].lower() + axis[1:].lower() + "_reverse"
-                # Simpler: just lowercase
-                key_en = axis.lower() + "_enable"
-                key_rev = axis.lower() + "_reverse"
-                result[key_en] = self._get_bool(motion, f"{axis}Enable", True)
-                result[key_rev] = self._get_bool(motion, f"{axis}Reverse", False)
-                result[f"{axis.lower()}_deadzone"] = self._get_int(motion, f"{axis}Deadzone", 0)
+                key = axis.lower()
+                result[f"{key}_enable"] = self._get_bool(m, f"{axis}Enable", True)
+                result[f"{key}_reverse"] = self._get_bool(m, f"{axis}Reverse", False)
+                result[f"{key}_deadzone"] = self._get_int(m, f"{axis}Deadzone", 0)
 
         # Buttons (BaseApp/Spaceball/Buttons/0, /1)
-        buttons = self._find_group(spaceball, "Buttons")
+        buttons = find(spaceball_idx, "Buttons")
         if buttons is not None:
-            btn0 = self._find_group(buttons, "0")
+            buttons_idx = index(buttons)
+            btn0 = find(buttons_idx, "0")
             if btn0 is not None:
-                result["btn0_command"] = self._get_text(btn0, "Command", "Std_ViewFitAll")
-            btn1 = self._find_group(buttons, "1")
+                result["btn0_command"] = self._get_text(index(btn0), "Command", "Std_ViewFitAll")
+            btn1 = find(buttons_idx, "1")
             if btn1 is not None:
-                result["btn1_command"] = self._get_text(btn1, "Command", "Std_ViewHome")
+                result["btn1_command"] = self._get_text(index(btn1), "Command", "Std_ViewHome")
 
         # View preferences (BaseApp/Preferences/View)
-        prefs = self._find_group(base_app, "Preferences")
+        prefs = find(base_idx, "Preferences")
         if prefs is not None:
-            view = self._find_group(prefs, "View")
+            view = find(index(prefs), "View")
             if view is not None:
+                v = index(view)
                 result["nav_style"] = self._get_text(
-                    view, "NavigationStyle", "Gui::BlenderNavigationStyle"
+                    v, "NavigationStyle", "Gui::BlenderNavigationStyle"
                 )
-                result["orbit_style"] = self._get_int(view, "OrbitStyle", 1)
+                result["orbit_style"] = self._get_int(v, "OrbitStyle", 1)
 
         return result
 
@@ -228,45 +264,52 @@ class FreeCADConfig:
         except ET.ParseError:
             return False
 
-        xml_root = tree.getroot()
-        fc_root = self._find_group(xml_root, "Root")
+        index, ensure = self._index, self._ensure_group
+        fc_root = self._find_group(index(tree.getroot()), "Root")
         if fc_root is None:
             return False
-        base_app = self._find_group(fc_root, "BaseApp")
+        base_app = self._find_group(index(fc_root), "BaseApp")
         if base_app is None:
             return False
+        base_idx = index(base_app)
 
         # Spaceball/Motion
-        spaceball = self._ensure_group(base_app, "Spaceball")
-        motion = self._ensure_group(spaceball, "Motion")
+        spaceball = ensure(base_app, base_idx, "Spaceball")
+        spaceball_idx = index(spaceball)
+        motion = ensure(spaceball, spaceball_idx, "Motion")
+        m = index(motion)
 
-        self._set_int(motion, "GlobalSensitivity", settings.get("global_sensitivity", -15))
-        self._set_bool(motion, "FlipYZ", settings.get("flip_yz", True))
-        self._set_bool(motion, "Dominant", settings.get("dominant", False))
+        self._set_int(motion, m, "GlobalSensitivity", settings.get("global_sensitivity", -15))
+        self._set_bool(motion, m, "FlipYZ", settings.get("flip_yz", True))
+        self._set_bool(motion, m, "Dominant", settings.get("dominant", False))
 
         for axis in ["PanLR", "PanUD", "Zoom", "Tilt", "Roll", "Spin"]:
-            key_en = axis.lower() + "_enable"
-            key_rev = axis.lower() + "_reverse"
-            self._set_bool(motion, f"{axis}Enable", settings.get(key_en, True))
-            self._set_bool(motion, f"{axis}Reverse", settings.get(key_rev, False))
-            self._set_int(motion, f"{axis}Deadzone", settings.get(f"{axis.lower()}_deadzone", 0))
+            key = axis.lower()
+            self._set_bool(motion, m, f"{axis}Enable", settings.get(f"{key}_enable", True))
+            self._set_bool(motion, m, f"{axis}Reverse", settings.get(f"{key}_reverse", False))
+            self._set_int(motion, m, f"{axis}Deadzone", settings.get(f"{key}_deadzone", 0))
 
         # Buttons
-        buttons = self._ensure_group(spaceball, "Buttons")
-        btn0 = self._ensure_group(buttons, "0")
-        self._set_text(btn0, "Command", settings.get("btn0_command", "Std_ViewFitAll"))
-        btn1 = self._ensure_group(buttons, "1")
-        self._set_text(btn1, "Command", settings.get("btn1_command", "Std_ViewHome"))
+        buttons = ensure(spaceball, spaceball_idx, "Buttons")
+        buttons_idx = index(buttons)
+        btn0 = ensure(buttons, buttons_idx, "0")
+        self._set_text(btn0, index(btn0), "Command", settings.get("btn0_command", "Std_ViewFitAll"))
+        btn1 = ensure(buttons, buttons_idx, "1")
+        self._set_text(btn1, index(btn1), "Command", settings.get("btn1_command", "Std_ViewHome"))
 
         # View preferences
-        prefs = self._ensure_group(base_app, "Preferences")
-        view = self._ensure_group(prefs, "View")
+        prefs = ensure(base_app, base_idx, "Preferences")
+        view = ensure(prefs, index(prefs), "View")
+        v = index(view)
         self._set_text(
-            view, "NavigationStyle", settings.get("nav_style", "Gui::BlenderNavigationStyle")
+            view, v, "NavigationStyle", settings.get("nav_style", "Gui::BlenderNavigationStyle")
         )
-        self._set_int(view, "OrbitStyle", settings.get("orbit_style", 1))
+        self._set_int(view, v, "OrbitStyle", settings.get("orbit_style", 1))
 
         tree.write(str(self.path), xml_declaration=True, encoding="utf-8")
+        # A rewrite within the filesystem's timestamp granularity could keep
+        # the old mtime and size, so never trust the memo across a write.
+        self._read_cache = None
         return True
 
 
@@ -291,22 +334,35 @@ class BlenderConfig:
         "ndof_panz_invert_axis": False,
     }
 
+    def __init__(self):
+        # (path, mtime_ns, size) of the JSON last parsed by read(), and the
+        # merged settings dict it produced.
+        self._read_cache = None
+
     def read(self):
-        if BLENDER_NDOF_PATH.exists():
-            try:
-                with open(BLENDER_NDOF_PATH) as f:
-                    saved = json.load(f)
-                result = dict(self.DEFAULTS)
-                result.update(saved)
-                return result
-            except (OSError, json.JSONDecodeError):
-                pass
-        return dict(self.DEFAULTS)
+        try:
+            st = BLENDER_NDOF_PATH.stat()
+        except OSError:
+            return dict(self.DEFAULTS)
+        key = (str(BLENDER_NDOF_PATH), st.st_mtime_ns, st.st_size)
+        if self._read_cache is not None and self._read_cache[0] == key:
+            return dict(self._read_cache[1])
+        try:
+            with open(BLENDER_NDOF_PATH) as f:
+                saved = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return dict(self.DEFAULTS)
+        result = dict(self.DEFAULTS)
+        result.update(saved)
+        self._read_cache = (key, result)
+        return dict(result)
 
     def write(self, settings):
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         with open(BLENDER_NDOF_PATH, "w") as f:
             json.dump(settings, f, indent=2)
+        # Same-size rewrites inside the mtime granularity keep the key.
+        self._read_cache = None
 
     def is_script_installed(self):
         """True if any detected Blender version has the script."""
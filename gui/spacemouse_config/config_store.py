@@ -0,0 +1,40 @@
+"""Serialise and persist config.json.
+
+Kept Qt-free so the helpers can be unit-tested without pulling in PySide6.
+"""
+
+import json
+import os
+
+
+def load_config(path):
+    """Return the parsed config at *path*, or None if missing or unreadable."""
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def serialize_config(config):
+    """Return the exact bytes written to config.json for *config*.
+
+    Key order is preserved, not sorted: profile order decides which
+    match_wm_class entry wins, both here and in the daemon.
+    """
+    return json.dumps(config, indent=2).encode()
+
+
+def write_config(path, blob):
+    """Atomically replace *path* with *blob*.
+
+    Writes a sibling temp file, fsyncs it and renames it over the target,
+    so a crash mid-write leaves either the old or the new config on disk
+    — never a truncated one the daemon would fail to parse.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
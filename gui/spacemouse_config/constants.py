@@ -6,7 +6,10 @@ from pathlib import Path
 
 CONFIG_DIR = Path.home() / ".config" / "spacemouse"
 CONFIG_PATH = CONFIG_DIR / "config.json"
-SOCK_PATH = f"/run/user/{os.getuid()}/spacemouse-cmd.sock"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "spacemouse"
+# Per-user runtime dir shared with the daemon (see src/spacemouse-desktop.c).
+RUN_DIR = Path(f"/run/user/{os.getuid()}")
+SOCK_PATH = str(RUN_DIR / "spacemouse-cmd.sock")
 
 FREECAD_RUNNING_WARNING = """\
 FreeCAD is running and will overwrite user.cfg on exit.
@@ -318,18 +321,17 @@ QMainWindow, QWidget {
     color: #ffffff;
 }
 
-/* Cards / Sections */
-QFrame.card {
+/* Cards / Sections. make_card() sets these objectNames; QSS's "class"
+   attribute is the C++ class name, so a .card selector never matches. */
+QFrame#card {
     background-color: #2a2a3e;
     border-radius: 8px;
     padding: 12px;
 }
-QFrame.card QLabel.section-title {
+QFrame#card QLabel#section-title {
     color: #a6adc8;
     font-size: 11px;
     font-weight: bold;
-    text-transform: uppercase;
-    padding-bottom: 4px;
 }
 
 /* Labels */
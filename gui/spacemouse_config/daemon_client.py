@@ -0,0 +1,39 @@
+"""Worker thread for fire-and-forget commands to the spacemouse-desktop daemon."""
+
+import queue
+
+from PySide6.QtCore import QThread
+
+from .daemon_socket import post_daemon_cmd
+
+
+class DaemonClient(QThread):
+    """Sends PROFILE/RELOAD commands from a worker thread, in call order.
+
+    post_daemon_cmd() does not wait for a reply, but connect() still blocks
+    for up to its 1 s timeout while the daemon is stalled with a full
+    listen backlog. Queueing here keeps focus changes and tray clicks on
+    the Qt main thread from ever waiting on daemon health. Commands whose
+    reply the GUI needs (STATUS, DEVICE) still use send_daemon_cmd().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._queue = queue.SimpleQueue()
+
+    def post(self, cmd):
+        """Queue *cmd* for sending; safe to call from any thread."""
+        self._queue.put(cmd)
+
+    def run(self):
+        while True:
+            cmd = self._queue.get()
+            if cmd is None:
+                return
+            post_daemon_cmd(cmd)
+
+    def stop(self):
+        # The sentinel queues behind pending commands, so a PROFILE posted
+        # just before quitting still reaches the daemon.
+        self._queue.put(None)
+        self.wait(2000)
@@ -10,19 +10,41 @@ from .constants import SOCK_PATH
 
 
 def send_daemon_cmd(cmd):
-    """Send command to spacemouse-desktop daemon via UNIX socket."""
+    """Send command to spacemouse-desktop daemon via UNIX socket.
+
+    The daemon serves exactly one command per connection (accept, reply,
+    close) from its single-threaded poll loop, so there is no connection to
+    keep open between calls. The socket is closed on every path, including
+    timeouts, so periodic STATUS polling never leaks descriptors.
+    """
     try:
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(1.0)
-        sock.connect(SOCK_PATH)
-        sock.sendall(f"{cmd}\n".encode())
-        response = sock.recv(1024).decode().strip()
-        sock.close()
-        return response
-    except (ConnectionRefusedError, FileNotFoundError, OSError):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(SOCK_PATH)
+            sock.sendall(f"{cmd}\n".encode())
+            return sock.recv(1024).decode().strip()
+    except OSError:
         return None
 
 
+def post_daemon_cmd(cmd):
+    """Send a command whose reply the caller does not need; return True if sent.
+
+    Connects, writes the line and closes without waiting for the daemon's
+    poll loop to get round to it, so focus-driven PROFILE switches never
+    stall the GUI thread. The daemon still reads the buffered line after
+    the close and discards its reply (send() with MSG_NOSIGNAL).
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(SOCK_PATH)
+            sock.sendall(f"{cmd}\n".encode())
+            return True
+    except OSError:
+        return False
+
+
 def query_device_info():
     """Ask the daemon what device is currently open.
 
@@ -70,11 +92,10 @@ def wait_for_daemon_socket(timeout=2.0):
     deadline = time.monotonic() + timeout
     while time.monotonic() < deadline:
         try:
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(0.2)
-            sock.connect(SOCK_PATH)
-            sock.close()
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.2)
+                sock.connect(SOCK_PATH)
             return True
-        except (ConnectionRefusedError, FileNotFoundError, OSError):
+        except OSError:
             time.sleep(0.05)
     return False
@@ -16,15 +16,15 @@ from PySide6.QtWidgets import (
 )
 
 from .constants import (
+    CACHE_DIR,
     COLOR_ACCENT,
     COLOR_BG_BASE,
-    COLOR_BG_CARD,
-    COLOR_TEXT_DIM,
 )
 
 # Re-export daemon-socket helpers so existing callers keep their import path.
 # The actual implementations live in daemon_socket.py (Qt-free for testing).
 from .daemon_socket import (  # noqa: F401
+    post_daemon_cmd,
     query_device_info,
     send_daemon_cmd,
     wait_for_daemon_socket,
@@ -77,18 +77,16 @@ class NoScrollComboBox(QComboBox):
 
 def make_card(title=None):
     """Create a styled card frame with optional section title."""
+    # Styled by the QFrame#card rules in DARK_THEME rather than a per-card
+    # setStyleSheet(), which would re-polish each card as it is built.
     card = QFrame()
-    card.setProperty("class", "card")
     card.setObjectName("card")
-    card.setStyleSheet(
-        f"QFrame#card {{ background-color: {COLOR_BG_CARD}; border-radius: 8px; padding: 12px; }}"
-    )
     layout = QVBoxLayout(card)
     layout.setContentsMargins(12, 12, 12, 12)
     layout.setSpacing(8)
     if title:
         lbl = QLabel(title)
-        lbl.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-size: 11px; font-weight: bold;")
+        lbl.setObjectName("section-title")
         layout.addWidget(lbl)
     return card, layout
 
@@ -118,10 +116,16 @@ def make_slider(minimum, maximum, value, decimals=0, suffix=""):
     val_label.setStyleSheet(f"color: {COLOR_ACCENT}; font-weight: bold; min-width: 45px;")
     val_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
 
-    def update_label(v):
-        if decimals > 0:
-            val_label.setText(f"{v / scale:.{decimals}f}{suffix}")
-        else:
+    # Pick the formatter once; valueChanged fires on every drag step.
+    if decimals > 0:
+        spec = f".{decimals}f"
+
+        def update_label(v):
+            val_label.setText(format(v / scale, spec) + suffix)
+
+    else:
+
+        def update_label(v):
             val_label.setText(f"{v}{suffix}")
 
     slider.valueChanged.connect(update_label)
@@ -152,7 +156,40 @@ def make_save_discard_cancel_box(parent, window_title, text, informative_text):
 # ── Tray icon pixmap ──────────────────────────────────────────────────
 
 
+# Bump when the drawing below changes so stale cached PNGs are ignored.
+_TRAY_ICON_VERSION = 1
+_tray_icon_cache = {}
+
+
+def _tray_icon_cache_path(text):
+    # Hex-encode the label: "||" (paused) is not something to put in a path.
+    return CACHE_DIR / f"tray-v{_TRAY_ICON_VERSION}-{text.encode().hex()}.png"
+
+
 def create_tray_icon_pixmap(text="SM"):
+    """Return the tray icon for *text*, rendered at most once per label.
+
+    Pixmaps are memoized in-process (pause toggles flip between two
+    labels) and cached as PNGs under $XDG_CACHE_HOME/spacemouse, so a
+    normal start skips QPainter text shaping and its fontconfig lookup.
+    """
+    pixmap = _tray_icon_cache.get(text)
+    if pixmap is not None:
+        return pixmap
+    cache = _tray_icon_cache_path(text)
+    pixmap = QPixmap(str(cache)) if cache.is_file() else QPixmap()
+    if pixmap.isNull():
+        pixmap = _render_tray_icon_pixmap(text)
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            pixmap.save(str(cache), "PNG")
+        except OSError:
+            pass  # read-only home — render again next start
+    _tray_icon_cache[text] = pixmap
+    return pixmap
+
+
+def _render_tray_icon_pixmap(text):
     pixmap = QPixmap(64, 64)
     pixmap.fill(QColor(0, 0, 0, 0))
     painter = QPainter(pixmap)
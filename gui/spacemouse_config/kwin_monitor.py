@@ -0,0 +1,143 @@
+"""KWin window monitor: receives window activations from a KWin script over D-Bus.
+
+Kept out of monitors.py so PySide6.QtDBus is only imported on KDE sessions.
+"""
+
+from PySide6.QtCore import ClassInfo, QObject, QThread, Signal, Slot
+from PySide6.QtDBus import QDBus, QDBusConnection, QDBusMessage
+
+from .constants import RUN_DIR
+from .profile_match import ProfileMatcher
+
+# wm_class strings received over D-Bus are untrusted — see the note above
+# the window monitors in monitors.py.
+
+
+_KWIN_SCRIPT_PATH = str(RUN_DIR / "spacemouse_wm_watch.js")
+
+
+@ClassInfo({"D-Bus Interface": "io.github.maik_0000ff.SpaceMouseConfig"})
+class _KWinFocusReceiver(QObject):
+    """D-Bus object the KWin script calls on every window activation."""
+
+    def __init__(self, handler):
+        super().__init__()
+        self._handler = handler
+
+    @Slot(str)
+    def WindowChanged(self, wm_class):
+        self._handler(wm_class)
+
+
+class KWinWindowMonitor(QThread):
+    """Monitors active window via KWin scripting and switches daemon profile.
+
+    KDE-Plasma-only. Registers a small D-Bus service on the session bus
+    and, over the same connection, loads a JS into KWin that calls its
+    WindowChanged method with the resourceClass on every window
+    activation; the thread's event loop delivers the call and emits
+    window_changed.
+    """
+
+    window_changed = Signal(str, str)
+
+    _KWIN_SCRIPT_NAME = "spacemouse-wm-watch"
+    _DBUS_SERVICE = "io.github.maik_0000ff.SpaceMouseConfig"
+    _DBUS_PATH = "/io/github/maik_0000ff/SpaceMouseConfig"
+    _KWIN_SCRIPT = (
+        "function report(w) {\n"
+        "    if (!w || !w.resourceClass)\n"
+        "        return;\n"
+        '    callDBus("io.github.maik_0000ff.SpaceMouseConfig",\n'
+        '             "/io/github/maik_0000ff/SpaceMouseConfig",\n'
+        '             "io.github.maik_0000ff.SpaceMouseConfig",\n'
+        '             "WindowChanged", String(w.resourceClass));\n'
+        "}\n"
+        "workspace.windowActivated.connect(report);\n"
+        "report(workspace.activeWindow);\n"
+    )
+
+    def __init__(self, profiles):
+        super().__init__()
+        self._running = True
+        self._matcher = ProfileMatcher(profiles)
+        self._last_profile = ""
+        self._last_class = None
+        self._installed = False
+
+    def update_profiles(self, profiles):
+        self._matcher = ProfileMatcher(profiles)
+        # Force re-evaluation: the next event must fire even if the resolved
+        # profile name is identical, and reloading the KWin script re-emits
+        # the initial workspace.activeWindow report so the currently focused
+        # window gets re-classified against the new profile list right away.
+        self._last_profile = ""
+        self._last_class = None
+        if self._installed:
+            self._install_kwin_script()
+
+    @staticmethod
+    def _kwin_scripting(method, *args):
+        """Call org.kde.kwin.Scripting.<method> over the in-process session bus.
+
+        A plain method-call message (no QDBusInterface) skips the
+        blocking introspection round-trip; the 2 s timeout matches the
+        old gdbus calls. Errors are ignored like before — a KWin without
+        scripting simply never calls WindowChanged.
+        """
+        msg = QDBusMessage.createMethodCall(
+            "org.kde.KWin", "/Scripting", "org.kde.kwin.Scripting", method
+        )
+        msg.setArguments(list(args))
+        QDBusConnection.sessionBus().call(msg, QDBus.CallMode.Block, 2000)
+
+    def _install_kwin_script(self):
+        with open(_KWIN_SCRIPT_PATH, "w") as f:
+            f.write(self._KWIN_SCRIPT)
+        self._kwin_scripting("unloadScript", self._KWIN_SCRIPT_NAME)
+        self._kwin_scripting("loadScript", _KWIN_SCRIPT_PATH, self._KWIN_SCRIPT_NAME)
+        self._kwin_scripting("start")
+
+    def _uninstall_kwin_script(self):
+        self._kwin_scripting("unloadScript", self._KWIN_SCRIPT_NAME)
+
+    def _handle_class(self, wm_class):
+        # KWin re-emits windowActivated for the same window on every
+        # click; a repeat of the previous class cannot change the profile.
+        if not wm_class or wm_class == self._last_class:
+            return
+        self._last_class = wm_class
+        profile_name = self._matcher.match(wm_class)
+        if profile_name != self._last_profile:
+            self._last_profile = profile_name
+            self.window_changed.emit(wm_class, profile_name)
+
+    def run(self):
+        # Register the receiver BEFORE loading the KWin script. The script
+        # reports the currently active window the moment it starts, and
+        # that call must find the service — otherwise the daemon stays on
+        # whatever profile it booted with until the user alt-tabs.
+        bus = QDBusConnection.sessionBus()
+        if not bus.isConnected() or not bus.registerService(self._DBUS_SERVICE):
+            return
+        # Created here so it lives in this thread and D-Bus calls are
+        # dispatched by this thread's event loop, not the GUI thread.
+        receiver = _KWinFocusReceiver(self._handle_class)
+        try:
+            if not bus.registerObject(
+                self._DBUS_PATH, receiver, QDBusConnection.RegisterOption.ExportAllSlots
+            ):
+                return
+            self._install_kwin_script()
+            self._installed = True
+            if self._running:
+                self.exec()
+        finally:
+            bus.unregisterObject(self._DBUS_PATH)
+            bus.unregisterService(self._DBUS_SERVICE)
+
+    def stop(self):
+        self._running = False
+        self.quit()
+        self._uninstall_kwin_script()
+        self.wait(2000)
@@ -1,17 +1,20 @@
-"""Background threads: live SpaceMouse event reader and KWin window monitor."""
+"""Background threads: live SpaceMouse event reader and window monitors."""
 
 import ast
 import ctypes
+import ctypes.util
 import json
 import os
 import re
 import select
 import socket
+import struct
 import subprocess
+import time
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QSocketNotifier, QThread, Signal
 
-from .profile_match import find_matching_profile
+from .profile_match import ProfileMatcher
 from .window_backend import (
     GNOME_WAYLAND,
     HYPRLAND,
@@ -83,17 +86,66 @@ class SpnavEvent(ctypes.Union):
     ]
 
 
+# x, y, z, rx, ry, rz are consecutive c_ints in SpnavMotion, so one
+# unpack_from() reads all six straight out of the event buffer.
+_MOTION_AXES = struct.Struct("6i")
+_MOTION_AXES_OFFSET = SpnavMotion.x.offset
+
+
+def _bind_libspnav(lib):
+    """Declare the prototypes of every libspnav call the reader makes."""
+    ev_p = ctypes.POINTER(SpnavEvent)
+    for name, argtypes in (
+        ("spnav_open", []),
+        ("spnav_close", []),
+        ("spnav_fd", []),
+        ("spnav_poll_event", [ev_p]),
+        ("spnav_wait_event", [ev_p]),
+    ):
+        fn = getattr(lib, name)
+        fn.argtypes = argtypes
+        fn.restype = ctypes.c_int
+
+
+_LIBSPNAV = None
+
+
+def load_libspnav():
+    """Load and bind libspnav once; return None when it is not installed.
+
+    Called at startup so a missing library is known before the reader
+    thread starts; the thread reuses the cached handle.
+    """
+    global _LIBSPNAV
+    if _LIBSPNAV is None:
+        try:
+            lib = ctypes.CDLL(ctypes.util.find_library("spnav") or "libspnav.so")
+        except OSError:
+            return None
+        _bind_libspnav(lib)
+        _LIBSPNAV = lib
+    return _LIBSPNAV
+
+
 # ── SpaceMouse Reader Thread ──────────────────────────────────────────
 
 
 class SpnavReader(QThread):
     """Reads SpaceMouse events via libspnav for live axis preview.
 
-    Uses select() on the spnav file descriptor instead of busy-polling.
+    Blocks in select() on the spnav file descriptor plus a self-pipe, so
+    the thread has zero wakeups while the device is idle; stop() and
+    set_suspended() write to the pipe to interrupt the wait immediately.
+    Each wakeup drains every buffered event. Motion is coalesced
+    latest-wins and emitted at most once per ``AXES_INTERVAL`` — the
+    device reports far faster than the preview bar can repaint. Button
+    events are emitted immediately.
     Automatically suspends event reading when 3D apps (Blender/FreeCAD)
     are active — no point updating a hidden preview bar.
     """
 
+    AXES_INTERVAL = 1 / 60
+
     axes_updated = Signal(list)
     button_pressed = Signal(int, bool)
 
@@ -102,22 +154,52 @@ class SpnavReader(QThread):
         self._running = True
         self._suspended = False
         self._lib = None
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+    def _wake(self):
+        """Interrupt a blocking select() in run()."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass  # pipe full (a wakeup is already pending) or closed
+
+    def _drain_wake(self):
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except OSError:
+            pass
+
+    def _wait_wake(self, timeout=None):
+        """Sleep until woken by stop()/set_suspended() or *timeout* elapses."""
+        ready, _, _ = select.select([self._wake_r], [], [], timeout)
+        if ready:
+            self._drain_wake()
 
     def set_suspended(self, suspended):
         """Suspend/resume event reading (called when 3D apps gain/lose focus)."""
         self._suspended = suspended
+        self._wake()
 
     def run(self):
-        try:
-            self._lib = ctypes.CDLL("libspnav.so")
-        except OSError:
+        self._lib = load_libspnav()
+        if self._lib is None:
             return
 
-        self._lib.spnav_fd.restype = ctypes.c_int
         connected = False
         spnav_fd = -1
 
         ev = SpnavEvent()
+        # Prototypes are declared once in _bind_libspnav(); bind the hot
+        # calls and the event pointer to locals so the drain loop skips
+        # the attribute lookups and byref() allocation per event.
+        ev_ref = ctypes.byref(ev)
+        poll_event = self._lib.spnav_poll_event
+        wait_event = self._lib.spnav_wait_event
+        pending_axes = None
+        last_emit = 0.0
         while self._running:
             # When suspended, disconnect from spnav so Blender/FreeCAD
             # get full event throughput (spacenavd multiplexing issue)
@@ -125,24 +207,36 @@ class SpnavReader(QThread):
                 if connected:
                     self._lib.spnav_close()
                     connected = False
-                self.msleep(200)
+                pending_axes = None
+                self._wait_wake()
                 continue
 
             if not connected:
                 if self._lib.spnav_open() == -1:
-                    self.msleep(1000)
+                    self._wait_wake(1.0)
                     continue
                 spnav_fd = self._lib.spnav_fd()
                 connected = True
                 # Drain stale events from buffer
-                while self._lib.spnav_poll_event(ctypes.byref(ev)):
+                while poll_event(ev_ref):
                     pass
 
-            ready, _, _ = select.select([spnav_fd], [], [], 0.5)
-            if not ready:
+            # Only wake on a timer while a coalesced motion sample is
+            # waiting for its frame slot; otherwise block indefinitely.
+            timeout = None
+            if pending_axes is not None:
+                timeout = max(0.0, last_emit + self.AXES_INTERVAL - time.monotonic())
+            ready, _, _ = select.select([spnav_fd, self._wake_r], [], [], timeout)
+            if self._wake_r in ready:
+                # stop() or a suspend toggle — re-check state before reading
+                self._drain_wake()
                 continue
 
-            if self._lib.spnav_poll_event(ctypes.byref(ev)):
+            # The fd is readable, so this returns without blocking; then
+            # drain whatever else libspnav already has buffered so a burst
+            # costs one select() wakeup rather than one per event.
+            got = ready and wait_event(ev_ref)
+            while got:
                 if ev.type == 1:  # SPNAV_EVENT_MOTION
                     # spacenavd swaps Ry/Rz vs the kernel's evdev mapping for
                     # the SpaceNavigator: physical twist arrives on motion.ry,
@@ -150,201 +244,44 @@ class SpnavReader(QThread):
                     # device directly, so to keep the "rz = Yaw/Twist" semantics
                     # consistent across config keys and live preview, swap them
                     # back here.
-                    self.axes_updated.emit(
-                        [
-                            ev.motion.x,
-                            ev.motion.y,
-                            ev.motion.z,
-                            ev.motion.rx,
-                            ev.motion.rz,
-                            ev.motion.ry,
-                        ]
-                    )
+                    x, y, z, rx, ry, rz = _MOTION_AXES.unpack_from(ev, _MOTION_AXES_OFFSET)
+                    pending_axes = [x, y, z, rx, rz, ry]
                 elif ev.type == 2:  # SPNAV_EVENT_BUTTON
                     self.button_pressed.emit(ev.button.bnum, bool(ev.button.press))
+                got = poll_event(ev_ref)
+
+            if pending_axes is not None:
+                now = time.monotonic()
+                if now - last_emit >= self.AXES_INTERVAL:
+                    self.axes_updated.emit(pending_axes)
+                    pending_axes = None
+                    last_emit = now
 
         if connected:
             self._lib.spnav_close()
 
     def stop(self):
         self._running = False
-        self.wait(2000)
+        self._wake()
+        # Close the self-pipe only once run() has returned — it may still be
+        # selecting on it. -1 makes a late _wake() fail with EBADF instead
+        # of writing to whatever file reuses the fd number.
+        if self.wait(2000):
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = -1
 
 
 # ── Window Monitor Thread ─────────────────────────────────────────────
 #
 # wm_class strings emitted via window_changed travel verbatim from the
-# compositor (KWin print(), xprop output, swaymsg JSON, Hyprland socket2,
+# compositor (KWin callDBus(), xprop output, swaymsg JSON, Hyprland socket2,
 # gdbus signal payload) into D-Bus signals and config-lookup keys. They
 # MUST NOT be passed to any shell, os.system(), or subprocess invocation
 # without explicit allow-listing — a malicious application can set its
 # own wm_class to arbitrary bytes.
 
 
-class KWinWindowMonitor(QThread):
-    """Monitors active window via KWin scripting and switches daemon profile.
-
-    KDE-Plasma-only. Loads a small JS into KWin via gdbus that prints
-    SPACEMOUSE_WM:<resourceClass> on every window activation; the thread
-    tails kwin_wayland's journal stream and emits window_changed.
-    """
-
-    window_changed = Signal(str, str)
-
-    _KWIN_SCRIPT_NAME = "spacemouse-wm-watch"
-    _KWIN_SCRIPT = (
-        "workspace.windowActivated.connect(function(w) {\n"
-        "    if (w && w.resourceClass)\n"
-        '        print("SPACEMOUSE_WM:" + w.resourceClass);\n'
-        "});\n"
-        "var cur = workspace.activeWindow;\n"
-        "if (cur && cur.resourceClass)\n"
-        '    print("SPACEMOUSE_WM:" + cur.resourceClass);\n'
-    )
-
-    def __init__(self, profiles):
-        super().__init__()
-        self._running = True
-        self._profiles = profiles
-        self._last_profile = ""
-        self._proc = None
-        self._script_path = f"/run/user/{os.getuid()}/spacemouse_wm_watch.js"
-
-    def update_profiles(self, profiles):
-        self._profiles = profiles
-        # Force re-evaluation: the next event must fire even if the resolved
-        # profile name is identical, and reloading the KWin script re-emits
-        # the initial workspace.activeWindow print so the currently focused
-        # window gets re-classified against the new profile list right away.
-        self._last_profile = ""
-        if self._proc is not None:
-            self._install_kwin_script()
-
-    def _install_kwin_script(self):
-        with open(self._script_path, "w") as f:
-            f.write(self._KWIN_SCRIPT)
-        try:
-            subprocess.run(
-                [
-                    "gdbus",
-                    "call",
-                    "--session",
-                    "--dest",
-                    "org.kde.KWin",
-                    "--object-path",
-                    "/Scripting",
-                    "--method",
-                    "org.kde.kwin.Scripting.unloadScript",
-                    self._KWIN_SCRIPT_NAME,
-                ],
-                capture_output=True,
-                timeout=2,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-        try:
-            subprocess.run(
-                [
-                    "gdbus",
-                    "call",
-                    "--session",
-                    "--dest",
-                    "org.kde.KWin",
-                    "--object-path",
-                    "/Scripting",
-                    "--method",
-                    "org.kde.kwin.Scripting.loadScript",
-                    self._script_path,
-                    self._KWIN_SCRIPT_NAME,
-                ],
-                capture_output=True,
-                timeout=2,
-            )
-            subprocess.run(
-                [
-                    "gdbus",
-                    "call",
-                    "--session",
-                    "--dest",
-                    "org.kde.KWin",
-                    "--object-path",
-                    "/Scripting",
-                    "--method",
-                    "org.kde.kwin.Scripting.start",
-                ],
-                capture_output=True,
-                timeout=2,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
-    def _uninstall_kwin_script(self):
-        try:
-            subprocess.run(
-                [
-                    "gdbus",
-                    "call",
-                    "--session",
-                    "--dest",
-                    "org.kde.KWin",
-                    "--object-path",
-                    "/Scripting",
-                    "--method",
-                    "org.kde.kwin.Scripting.unloadScript",
-                    self._KWIN_SCRIPT_NAME,
-                ],
-                capture_output=True,
-                timeout=2,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
-    def _find_matching_profile(self, wm_class):
-        return find_matching_profile(wm_class, self._profiles)
-
-    def run(self):
-        # Start the journal tail BEFORE loading the KWin script. The script
-        # prints the currently active window the moment it starts, and we
-        # need that line to land in the stream we're reading — otherwise the
-        # daemon stays on whatever profile it booted with until the user
-        # alt-tabs to another window.
-        try:
-            self._proc = subprocess.Popen(
-                ["journalctl", "--user", "-t", "kwin_wayland", "-f", "-o", "cat", "--since", "now"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                bufsize=1,
-            )
-        except FileNotFoundError:
-            return
-        try:
-            self._install_kwin_script()
-            stdout = self._proc.stdout
-            if not stdout:
-                return
-            while self._running:
-                line = stdout.readline()
-                if not line:
-                    break
-                if not line.startswith("SPACEMOUSE_WM:"):
-                    continue
-                wm_class = line.strip().split(":", 1)[1]
-                profile_name = self._find_matching_profile(wm_class)
-                if profile_name != self._last_profile:
-                    self._last_profile = profile_name
-                    self.window_changed.emit(wm_class, profile_name)
-        finally:
-            _terminate_proc(self._proc)
-            self._proc = None
-
-    def stop(self):
-        self._running = False
-        _terminate_proc(self._proc)
-        self._uninstall_kwin_script()
-        self.wait(2000)
-
-
 # ── X11 Window Monitor Thread ─────────────────────────────────────────
 
 
@@ -363,13 +300,13 @@ class X11WindowMonitor(QThread):
     def __init__(self, profiles):
         super().__init__()
         self._running = True
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         self._last_profile = ""
         self._last_wid = None
         self._proc = None
 
     def update_profiles(self, profiles):
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         # Force re-evaluation on the next event.
         self._last_profile = ""
         self._last_wid = None
@@ -412,7 +349,7 @@ class X11WindowMonitor(QThread):
                 wm_class = self._wm_class_for(wid)
                 if not wm_class:
                     continue
-                profile_name = find_matching_profile(wm_class, self._profiles)
+                profile_name = self._matcher.match(wm_class)
                 if profile_name != self._last_profile:
                     self._last_profile = profile_name
                     self.window_changed.emit(wm_class, profile_name)
@@ -426,68 +363,91 @@ class X11WindowMonitor(QThread):
         self.wait(2000)
 
 
-# ── Sway Window Monitor Thread ────────────────────────────────────────
+# ── Sway Window Monitor ───────────────────────────────────────────────
 
 
-class SwayWindowMonitor(QThread):
+class SwayWindowMonitor(QObject):
     """Monitors active window on Sway via swaymsg event subscription.
 
     `swaymsg -t subscribe -m '["window"]'` streams one JSON object per
     event. We pick out focus changes and read the focused container's
     app_id (native Wayland) or window_properties.class (Xwayland).
+
+    Not a QThread: a QSocketNotifier on swaymsg's stdout wakes the Qt
+    main loop only when output arrives, so no thread sits parked in
+    readline() and stop() has nothing to join. Exposes the same
+    start/stop/update_profiles/window_changed surface as the threads.
     """
 
     window_changed = Signal(str, str)
 
     def __init__(self, profiles):
         super().__init__()
-        self._running = True
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         self._last_profile = ""
         self._proc = None
+        self._notifier = None
+        self._buf = bytearray()
 
     def update_profiles(self, profiles):
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         self._last_profile = ""
 
-    def run(self):
+    def start(self):
         try:
             self._proc = subprocess.Popen(
                 ["swaymsg", "-t", "subscribe", "-m", '["window"]'],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                text=True,
-                bufsize=1,
+                bufsize=0,
             )
         except FileNotFoundError:
             return
+        fd = self._proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        self._notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+        self._notifier.activated.connect(self._on_readable)
+
+    def _on_readable(self):
         try:
-            stdout = self._proc.stdout
-            if not stdout:
-                return
-            while self._running:
-                line = stdout.readline()
-                if not line:
-                    break
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                wm_class = parse_sway_focus_event(obj)
-                if not wm_class:
-                    continue
-                profile_name = find_matching_profile(wm_class, self._profiles)
-                if profile_name != self._last_profile:
-                    self._last_profile = profile_name
-                    self.window_changed.emit(wm_class, profile_name)
-        finally:
-            _terminate_proc(self._proc)
-            self._proc = None
+            chunk = os.read(self._proc.stdout.fileno(), 4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        if not chunk:
+            # swaymsg exited (compositor gone) — same as the old EOF break.
+            self.stop()
+            return
+        self._buf += chunk
+        *lines, rest = self._buf.split(b"\n")
+        self._buf = rest
+        for line in lines:
+            self._handle_line(line)
+
+    def _handle_line(self, line):
+        try:
+            obj = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        wm_class = parse_sway_focus_event(obj)
+        if not wm_class:
+            return
+        profile_name = self._matcher.match(wm_class)
+        if profile_name != self._last_profile:
+            self._last_profile = profile_name
+            self.window_changed.emit(wm_class, profile_name)
 
     def stop(self):
-        self._running = False
-        _terminate_proc(self._proc)
-        self.wait(2000)
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+        if self._proc is not None:
+            _terminate_proc(self._proc)
+            self._proc.stdout.close()
+            self._proc = None
+        self._buf.clear()
 
 
 # ── Hyprland Window Monitor Thread ────────────────────────────────────
@@ -507,12 +467,12 @@ class HyprlandWindowMonitor(QThread):
     def __init__(self, profiles):
         super().__init__()
         self._running = True
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         self._last_profile = ""
         self._sock = None
 
     def update_profiles(self, profiles):
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         self._last_profile = ""
 
     def _socket_path(self):
@@ -548,7 +508,7 @@ class HyprlandWindowMonitor(QThread):
                     wm_class = parse_hyprland_event(line.decode("utf-8", errors="replace"))
                     if not wm_class:
                         continue
-                    profile_name = find_matching_profile(wm_class, self._profiles)
+                    profile_name = self._matcher.match(wm_class)
                     if profile_name != self._last_profile:
                         self._last_profile = profile_name
                         self.window_changed.emit(wm_class, profile_name)
@@ -624,13 +584,13 @@ class GnomeWaylandWindowMonitor(QThread):
     def __init__(self, profiles):
         super().__init__()
         self._running = True
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         self._last_profile = ""
         self._last_class = None
         self._proc = None
 
     def update_profiles(self, profiles):
-        self._profiles = profiles
+        self._matcher = ProfileMatcher(profiles)
         self._last_profile = ""
         self._last_class = None
 
@@ -677,7 +637,7 @@ class GnomeWaylandWindowMonitor(QThread):
         if not wm_class or wm_class == self._last_class:
             return
         self._last_class = wm_class
-        profile_name = find_matching_profile(wm_class, self._profiles)
+        profile_name = self._matcher.match(wm_class)
         if profile_name != self._last_profile:
             self._last_profile = profile_name
             self.window_changed.emit(wm_class, profile_name)
@@ -787,6 +747,17 @@ def make_window_monitor(profiles):
     """
     backend = select_backend()
     if backend == KWIN:
+        # Imported here so sessions without KWin never need QtDBus, which
+        # Debian/Ubuntu ship as a separate python3-pyside6.qtdbus package.
+        try:
+            from .kwin_monitor import KWinWindowMonitor
+        except ImportError as exc:
+            print(
+                f"spacemouse-config: KWin window monitor unavailable ({exc}) — "
+                "install python3-pyside6.qtdbus for automatic profile switching.",
+                flush=True,
+            )
+            return None
         return KWinWindowMonitor(profiles)
     if backend == X11:
         return X11WindowMonitor(profiles)
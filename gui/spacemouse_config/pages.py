@@ -2,7 +2,7 @@
 
 import subprocess
 
-from PySide6.QtCore import QTimer, Signal
+from PySide6.QtCore import QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QFormLayout,
     QFrame,
@@ -49,6 +49,19 @@ from .helpers import NoScrollComboBox, make_card, make_save_discard_cancel_box,
 from .key_combo_dialog import KeyComboDialog, format_combo, parse_combo_string
 from .widgets import AxesCard
 
+# Value → combo-index lookups for restoring saved settings into combos.
+_AXIS_ACTION_INDEX = {a: i for i, a in enumerate(AXIS_ACTIONS)}
+_BTN_ACTION_INDEX = {a: i for i, a in enumerate(BTN_ACTIONS)}
+_FREECAD_BTN_INDEX = {c: i for i, c in enumerate(FREECAD_BTN_COMMANDS)}
+_FREECAD_NAV_INDEX = {n: i for i, n in enumerate(FREECAD_NAV_STYLES)}
+_FREECAD_ORBIT_VALUES = list(FREECAD_ORBIT_STYLES.values())
+_FREECAD_ORBIT_INDEX = {v: i for i, v in enumerate(_FREECAD_ORBIT_VALUES)}
+
+# FreeCAD/Blender sliders report every drag step; their ``changed`` signal
+# is coalesced over this window so the window title and live-bar deadzones
+# update once per burst instead of once per step.
+CHANGED_COALESCE_MS = 50
+
 # ── DesktopPage ───────────────────────────────────────────────────────
 
 
@@ -208,6 +221,7 @@ class DesktopPage(QWidget):
         outer.setContentsMargins(0, 0, 0, 0)
         outer.addWidget(scroll)
 
+    @Slot()
     def _emit_changed(self):
         if not self._building:
             self.changed.emit()
@@ -219,14 +233,6 @@ class DesktopPage(QWidget):
     # would paint its own panel-coloured rectangle behind the controls,
     # breaking the visual match with AxesCard (which also uses bare
     # HBoxes inside its card).
-    def _reset_button_rows(self):
-        for timer in self._highlight_timers.values():
-            timer.stop()
-        self._highlight_timers.clear()
-        for bnum in list(self.btn_rows):
-            self._discard_row_widgets(self.btn_rows[bnum])
-        self.btn_rows.clear()
-
     @staticmethod
     def _discard_row_widgets(row):
         for key in ("label", "combo", "edit_btn", "remove_btn"):
@@ -285,7 +291,7 @@ class DesktopPage(QWidget):
         label.setFixedWidth(72)
         combo = NoScrollComboBox()
         combo.addItems(BTN_ACTION_LABELS)
-        idx = BTN_ACTIONS.index(action_str) if action_str in BTN_ACTIONS else 0
+        idx = _BTN_ACTION_INDEX.get(action_str, 0)
         combo.setCurrentIndex(idx)
         combo.setFixedWidth(160)
         combo.currentIndexChanged.connect(lambda _, b=bnum: self._on_action_changed(b))
@@ -312,6 +318,46 @@ class DesktopPage(QWidget):
         self._relayout_buttons()
         return self.btn_rows[bnum]
 
+    def _set_row_action(self, bnum, action):
+        """Point an existing row at `action` (string or dict) in place.
+
+        Signals on the combo are blocked so a programmatic reload does
+        not pop the per-action editor dialog or emit ``changed``."""
+        row = self.btn_rows[bnum]
+        action_str, extras = self._action_from_value(action)
+        idx = _BTN_ACTION_INDEX.get(action_str, 0)
+        blocked = row["combo"].blockSignals(True)
+        row["combo"].setCurrentIndex(idx)
+        row["combo"].blockSignals(blocked)
+        row["exec_argv"] = extras.get("exec_argv")
+        row["key_combo"] = extras.get("key_combo")
+        row["action_idx"] = idx
+        self._refresh_row_affordance(bnum)
+        self._update_remove_visibility(bnum)
+
+    def _sync_button_rows(self, actions):
+        """Reconcile the button rows with an ``{bnum: action}`` mapping.
+
+        Rows whose bnum survives the reload are updated in place; only
+        vanished bnums are discarded and new ones built, so reloading
+        the config does not tear down and recreate every row's widgets.
+        """
+        stale = [bnum for bnum in self.btn_rows if bnum not in actions]
+        for bnum in stale:
+            timer = self._highlight_timers.pop(bnum, None)
+            if timer:
+                timer.stop()
+            self._discard_row_widgets(self.btn_rows.pop(bnum))
+        for bnum, action in actions.items():
+            if bnum in self.btn_rows:
+                self._set_row_action(bnum, action)
+            else:
+                # Pass the raw value (string or dict) — _add_button_row →
+                # _action_from_value normalises both shapes onto the row state.
+                self._add_button_row(bnum, action)
+        if stale:
+            self._relayout_buttons()
+
     def _on_action_changed(self, bnum):
         """Combo selection changed: open the per-action editor dialog the
         first time a data-carrying action (exec, custom combo) is picked.
@@ -610,7 +656,7 @@ class DesktopPage(QWidget):
         amap = default.get("axis_mapping", {})
         for i, key in enumerate(AXIS_KEYS):
             action = amap.get(key, "none")
-            idx = AXIS_ACTIONS.index(action) if action in AXIS_ACTIONS else 0
+            idx = _AXIS_ACTION_INDEX.get(action, 0)
             self.axes_card.action_combos[i].setCurrentIndex(idx)
 
         adz = default.get("axis_deadzone", {})
@@ -622,7 +668,6 @@ class DesktopPage(QWidget):
             self.axes_card.invert_toggles[i].setChecked(bool(ainv.get(key, False)))
 
         bmap = default.get("button_mapping", {})
-        self._reset_button_rows()
         configured = set()
         for key in bmap:
             try:
@@ -631,10 +676,8 @@ class DesktopPage(QWidget):
                 continue
             if 0 <= bnum < MAX_BUTTONS:
                 configured.add(bnum)
-        # Pass the raw value (string or dict) — _add_button_row →
-        # _action_from_value normalises both shapes onto the row state.
-        for bnum in sorted(configured | set(DEFAULT_BUTTON_ROWS)):
-            self._add_button_row(bnum, bmap.get(str(bnum), "none"))
+        wanted = configured | set(DEFAULT_BUTTON_ROWS) | set(range(self._device_button_count))
+        self._sync_button_rows({bnum: bmap.get(str(bnum), "none") for bnum in sorted(wanted)})
 
         self.dswitch_thresh_s.setValue(default.get("desktop_switch_threshold", 200))
         self.dswitch_cool_s.setValue(default.get("desktop_switch_cooldown_ms", 500))
@@ -648,19 +691,19 @@ class DesktopPage(QWidget):
         data["scroll_exponent"] = self.scroll_exp_s.value() / 10.0
         data["deadzone"] = self.deadzone_s.value()
 
-        data["axis_mapping"] = {}
-        for i, key in enumerate(AXIS_KEYS):
-            data["axis_mapping"][key] = AXIS_ACTIONS[self.axes_card.action_combos[i].currentIndex()]
-
-        data["axis_deadzone"] = {}
-        for i, key in enumerate(AXIS_KEYS):
-            data["axis_deadzone"][key] = self.axes_card.deadzone_sliders[i].value()
-
-        data["axis_invert"] = {}
-        for i, key in enumerate(AXIS_KEYS):
-            data["axis_invert"][key] = self.axes_card.invert_toggles[i].isChecked()
+        card = self.axes_card
+        data["axis_mapping"] = {
+            key: AXIS_ACTIONS[combo.currentIndex()]
+            for key, combo in zip(AXIS_KEYS, card.action_combos)
+        }
+        data["axis_deadzone"] = {
+            key: slider.value() for key, slider in zip(AXIS_KEYS, card.deadzone_sliders)
+        }
+        data["axis_invert"] = {
+            key: toggle.isChecked() for key, toggle in zip(AXIS_KEYS, card.invert_toggles)
+        }
 
-        data["button_mapping"] = {}
+        bmap = data["button_mapping"] = {}
         for bnum in sorted(self.btn_rows):
             row = self.btn_rows[bnum]
             action_str = BTN_ACTIONS[row["combo"].currentIndex()]
@@ -669,21 +712,15 @@ class DesktopPage(QWidget):
                 # Empty argv = user picked exec but didn't configure it.
                 # Save "none" rather than an exec stub the daemon would
                 # silently skip — keeps the JSON honest.
-                if argv:
-                    data["button_mapping"][str(bnum)] = {"type": "exec", "cmd": argv}
-                else:
-                    data["button_mapping"][str(bnum)] = "none"
+                bmap[str(bnum)] = {"type": "exec", "cmd": argv} if argv else "none"
             elif action_str == BTN_ACTION_KEY_CUSTOM:
                 combo_str = row.get("key_combo") or ""
                 # Same logic as exec: a sentinel without a payload
                 # downgrades to "none" rather than writing "key:" with
                 # an empty body the daemon would silently drop.
-                if combo_str:
-                    data["button_mapping"][str(bnum)] = f"key:{combo_str}"
-                else:
-                    data["button_mapping"][str(bnum)] = "none"
+                bmap[str(bnum)] = f"key:{combo_str}" if combo_str else "none"
             else:
-                data["button_mapping"][str(bnum)] = action_str
+                bmap[str(bnum)] = action_str
 
         data["desktop_switch_threshold"] = self.dswitch_thresh_s.value()
         data["desktop_switch_cooldown_ms"] = self.dswitch_cool_s.value()
@@ -724,6 +761,19 @@ class DesktopPage(QWidget):
         self._building = False
 
 
+def _make_changed_timer(page):
+    """Single-shot timer that re-emits *page*.changed once a burst settles.
+
+    start() on an active timer just pushes the deadline out, which is the
+    whole debounce.
+    """
+    timer = QTimer(page)
+    timer.setSingleShot(True)
+    timer.setInterval(CHANGED_COALESCE_MS)
+    timer.timeout.connect(page.changed.emit)
+    return timer
+
+
 # ── FreeCADPage ───────────────────────────────────────────────────────
 
 
@@ -739,6 +789,7 @@ class FreeCADPage(QWidget):
     def __init__(self):
         super().__init__()
         self._building = True
+        self._changed_timer = _make_changed_timer(self)
         self._fc = FreeCADConfig()
         self._setup_ui()
         self._load_settings()
@@ -868,15 +919,24 @@ class FreeCADPage(QWidget):
         self._running_timer.timeout.connect(self._check_running)
         self._running_timer.start(5000)
 
+    @Slot()
     def _emit_changed(self):
         if not self._building:
-            self.changed.emit()
+            self._changed_timer.start()
             self._dirty = True
 
+    def flush_changed(self):
+        """Emit a coalesced ``changed`` now if one is still pending."""
+        if self._changed_timer.isActive():
+            self._changed_timer.stop()
+            self.changed.emit()
+
     def _emit_unchanged(self):
+        self._changed_timer.stop()
         self.unchanged.emit()
         self._dirty = False
 
+    @Slot()
     def _check_running(self):
         self.running_warn.setVisible(self._fc.is_running())
 
@@ -895,16 +955,15 @@ class FreeCADPage(QWidget):
 
         for i, combo in enumerate(self.fc_btn_combos):
             cmd = settings.get(f"btn{i}_command", "")
-            idx = FREECAD_BTN_COMMANDS.index(cmd) if cmd in FREECAD_BTN_COMMANDS else 0
+            idx = _FREECAD_BTN_INDEX.get(cmd, 0)
             combo.setCurrentIndex(idx)
 
         nav = settings.get("nav_style", "")
-        idx = FREECAD_NAV_STYLES.index(nav) if nav in FREECAD_NAV_STYLES else 1
+        idx = _FREECAD_NAV_INDEX.get(nav, 1)
         self.fc_nav_combo.setCurrentIndex(idx)
 
         orbit = settings.get("orbit_style", 1)
-        orbit_values = list(FREECAD_ORBIT_STYLES.values())
-        idx = orbit_values.index(orbit) if orbit in orbit_values else 0
+        idx = _FREECAD_ORBIT_INDEX.get(orbit, 0)
         self.fc_orbit_combo.setCurrentIndex(idx)
 
     def _revert_previously_selected_path(self):
@@ -971,8 +1030,7 @@ class FreeCADPage(QWidget):
             s[f"btn{i}_command"] = FREECAD_BTN_COMMANDS[idx]
 
         s["nav_style"] = FREECAD_NAV_STYLES[self.fc_nav_combo.currentIndex()]
-        orbit_values = list(FREECAD_ORBIT_STYLES.values())
-        s["orbit_style"] = orbit_values[self.fc_orbit_combo.currentIndex()]
+        s["orbit_style"] = _FREECAD_ORBIT_VALUES[self.fc_orbit_combo.currentIndex()]
         return s
 
     def warn_if_running(self):
@@ -984,6 +1042,9 @@ class FreeCADPage(QWidget):
 
     def apply_settings(self):
         """Write settings to FreeCAD user.cfg."""
+        # Deliver a pending change first so it cannot re-dirty the window
+        # after the unchanged signal below.
+        self.flush_changed()
         if (not self._fc.is_available()) or self.warn_if_running():
             # if FreeCAD is running, warn_if_running showed a warning. do nothing.
             return False
@@ -1007,6 +1068,7 @@ class BlenderPage(QWidget):
     def __init__(self):
         super().__init__()
         self._building = True
+        self._changed_timer = _make_changed_timer(self)
         self._bc = BlenderConfig()
         self._setup_ui()
         self._load_settings()
@@ -1106,8 +1168,15 @@ class BlenderPage(QWidget):
         outer.setContentsMargins(0, 0, 0, 0)
         outer.addWidget(scroll)
 
+    @Slot()
     def _emit_changed(self):
         if not self._building:
+            self._changed_timer.start()
+
+    def flush_changed(self):
+        """Emit a coalesced ``changed`` now if one is still pending."""
+        if self._changed_timer.isActive():
+            self._changed_timer.stop()
             self.changed.emit()
 
     def _update_script_status(self):
@@ -1154,6 +1223,7 @@ class BlenderPage(QWidget):
             self.script_status.setStyleSheet(f"color: {COLOR_OK}; background: transparent;")
             self.install_btn.setText("Reinstall Startup Script")
 
+    @Slot()
     def _install_script(self):
         written = self._bc.install_startup_script()
         if not written:
@@ -1254,4 +1324,5 @@ class BlenderPage(QWidget):
 
     def apply_settings(self):
         """Write settings to blender-ndof.json."""
+        self.flush_changed()
         self._bc.write(self.get_settings())
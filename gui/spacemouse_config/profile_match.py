@@ -4,10 +4,68 @@ Pure-logic helper extracted from monitors.WindowMonitor so it can be unit
 tested without pulling in PySide6.
 """
 
+import re
 
-def _wm_class_matches(wm_lower, candidate):
-    cand_lower = candidate.lower()
-    return cand_lower == wm_lower or wm_lower.startswith(cand_lower) or cand_lower in wm_lower
+# Recent wm_class → profile lookups kept per matcher. Focus flips between
+# a handful of windows, so a small table catches nearly every activation.
+MATCH_CACHE_SIZE = 64
+
+
+class ProfileMatcher:
+    """Precompiled :func:`find_matching_profile` for one profiles dict.
+
+    Patterns are lowercased once at construction instead of on every
+    focus change, a wm_class equal to a pattern resolves with one dict
+    lookup, and other recent results are memoized by raw ``wm_class``.
+    Build a new matcher whenever the profiles change.
+    """
+
+    def __init__(self, profiles):
+        # An equal or prefix match is also a substring match, so one
+        # ``in`` test per pattern covers all three cases. Order is kept
+        # so the first matching profile still wins.
+        self._patterns = tuple(
+            (wc.lower(), name)
+            for name, profile in profiles.items()
+            if name != "default"
+            for wc in profile.get("match_wm_class", [])
+        )
+        # One alternation over every pattern answers "does anything match
+        # at all?" in a single C-level search — the common case for
+        # ordinary desktop windows, which fall through to default. It
+        # cannot replace the ordered scan: re picks the leftmost match in
+        # wm_class, not the first profile.
+        self._any = (
+            re.compile("|".join(re.escape(w) for w, _ in self._patterns))
+            if self._patterns
+            else None
+        )
+        # Windows of configured apps usually report exactly the class in
+        # match_wm_class, so resolve each pattern up front. The value is
+        # the ordered-scan result, not just the pattern's own profile: an
+        # earlier profile's shorter pattern may also be a substring of it.
+        self._exact = {}
+        for w, _ in self._patterns:
+            if w not in self._exact:
+                self._exact[w] = next(n for p, n in self._patterns if p in w)
+        self._cache = {}
+
+    def match(self, wm_class):
+        name = self._cache.get(wm_class)
+        if name is not None:
+            return name
+        wm_lower = wm_class.lower()
+        name = self._exact.get(wm_lower)
+        if name is not None:
+            return name
+        if self._any is None or not self._any.search(wm_lower):
+            name = "default"
+        else:
+            name = next(n for w, n in self._patterns if w in wm_lower)
+        if len(self._cache) >= MATCH_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[wm_class] = name
+        return name
 
 
 def find_matching_profile(wm_class, profiles):
@@ -22,12 +80,8 @@ def find_matching_profile(wm_class, profiles):
     The matcher returns profile names only. Passthrough behavior is a
     daemon-side concern, auto-triggered when a profile has all axes and
     buttons set to ``none`` — see ``src/config.c``.
+
+    One-off convenience wrapper; monitors that match on every focus
+    change hold a :class:`ProfileMatcher` instead.
     """
-    wm_lower = wm_class.lower()
-    for name, profile in profiles.items():
-        if name == "default":
-            continue
-        for wc in profile.get("match_wm_class", []):
-            if _wm_class_matches(wm_lower, wc):
-                return name
-    return "default"
+    return ProfileMatcher(profiles).match(wm_class)
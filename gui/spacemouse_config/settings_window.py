@@ -1,8 +1,9 @@
 """SettingsWindow — main settings UI with sidebar + apply/save dialog."""
 
-from PySide6.QtCore import QTimer, Signal
+from PySide6.QtCore import QTimer, Signal, Slot
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
+    QButtonGroup,
     QHBoxLayout,
     QLabel,
     QMainWindow,
@@ -32,6 +33,9 @@ class SettingsWindow(QMainWindow):
     window_focused = Signal()
     window_unfocused = Signal()
 
+    # Daemon STATUS/DEVICE poll interval while the window is visible.
+    STATUS_POLL_MS = 5000
+
     def __init__(
         self,
         config_data,
@@ -77,15 +81,18 @@ class SettingsWindow(QMainWindow):
         )
         sb_layout.addWidget(subtitle)
 
+        # One exclusive group with a single connection routes every
+        # sidebar click to _switch_page by button id.
         self._page_buttons = []
+        self._page_group = QButtonGroup(self)
         pages = [("Desktop", 0), ("FreeCAD", 1), ("Blender", 2)]
         for label, idx in pages:
             btn = QPushButton(label)
             btn.setCheckable(True)
-            btn.setAutoExclusive(True)
-            btn.clicked.connect(lambda _, i=idx: self._switch_page(i))
+            self._page_group.addButton(btn, idx)
             sb_layout.addWidget(btn)
             self._page_buttons.append(btn)
+        self._page_group.idClicked.connect(self._switch_page)
 
         sb_layout.addStretch()
 
@@ -194,13 +201,15 @@ class SettingsWindow(QMainWindow):
         self._sync_deadzones()
         self._refresh_apply_button()
 
-        # Status timer (stopped by default — started when window becomes visible)
+        # Status timer (stopped by default — runs only while the window is
+        # visible, see showEvent/hideEvent)
         self._status_timer = QTimer()
         self._status_timer.timeout.connect(self._update_status)
 
         self._dirty = False
         self._last_device_key = None
 
+    @Slot(int)
     def _switch_page(self, idx):
         self.stack.setCurrentIndex(idx)
         self._sync_deadzones()
@@ -212,20 +221,24 @@ class SettingsWindow(QMainWindow):
         no-op action."""
         self.apply_btn.setVisible(self.stack.currentIndex() != 0)
 
+    @Slot()
     def _mark_dirty(self):
         self._dirty = True
         self.setWindowTitle("SpaceMouse Control *")
 
+    @Slot()
     def _mark_clean(self):
         self._dirty = False
         self.setWindowTitle("SpaceMouse Control")
 
+    @Slot()
     def _save_desktop(self):
         """Persist desktop-page widget state + autostart on every change."""
         config = self.desktop_page.get_all_config()
         config.setdefault("settings", {})["autostart"] = self.autostart_cb.isChecked()
         self.on_save(config)
 
+    @Slot()
     def _sync_deadzones(self):
         """Push current page's deadzone values to the live preview bar."""
         idx = self.stack.currentIndex()
@@ -246,6 +259,7 @@ class SettingsWindow(QMainWindow):
             global_dz = self.blender_page.bl_deadzone_s.value()
             self.live_bar.set_deadzones([global_dz] * 6)
 
+    @Slot()
     def _apply(self):
         """Commit the FreeCAD or Blender page. Desktop is live-apply, so
         the Apply button is hidden there and this method is unreachable."""
@@ -273,10 +287,11 @@ class SettingsWindow(QMainWindow):
                 self, "Applied", "Blender NDOF settings saved.\nRestart Blender to apply."
             )
 
+    @Slot()
     def _update_status(self):
         # Two synchronous daemon IPCs per tick (STATUS + DEVICE), both on
         # the Qt main thread with the 1 s socket timeout in send_daemon_cmd.
-        # Acceptable at the current 2 s tick rate; revisit if the timer
+        # Acceptable at the STATUS_POLL_MS tick rate; revisit if the timer
         # rate goes up or more poll-style commands are added.
         resp = send_daemon_cmd("STATUS")
         self.live_bar.set_daemon_status(resp is not None)
@@ -334,10 +349,16 @@ class SettingsWindow(QMainWindow):
 
     def showEvent(self, event):
         super().showEvent(event)
+        # Refresh right away instead of showing a stale dot for a tick, but
+        # from the event loop: the STATUS/DEVICE round-trips block for up to
+        # 1 s each on a stalled daemon, and the window should paint first.
+        QTimer.singleShot(0, self._update_status)
+        self._status_timer.start(self.STATUS_POLL_MS)
         self.window_shown.emit()
 
     def hideEvent(self, event):
         super().hideEvent(event)
+        self._status_timer.stop()
         self.window_hidden.emit()
 
     def changeEvent(self, event):
@@ -349,6 +370,9 @@ class SettingsWindow(QMainWindow):
                 self.window_unfocused.emit()
 
     def closeEvent(self, event):
+        # A coalesced slider change may not have marked the window dirty yet.
+        self.freecad_page.flush_changed()
+        self.blender_page.flush_changed()
         if self._dirty:
             msg = make_save_discard_cancel_box(
                 parent=self,
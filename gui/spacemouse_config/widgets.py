@@ -3,14 +3,16 @@
 from PySide6.QtCore import (
     Property,
     QEasingCurve,
+    QEvent,
     QLineF,
     QPropertyAnimation,
     QRectF,
     QSize,
     Qt,
     Signal,
+    Slot,
 )
-from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -26,6 +28,7 @@ from .constants import (
     COLOR_BG_RAISED,
     COLOR_ERROR,
     COLOR_OK,
+    COLOR_TEXT,
     COLOR_TEXT_DIM,
     COLOR_TEXT_MUTED,
 )
@@ -41,6 +44,15 @@ class ToggleSwitch(QWidget):
 
     stateChanged = Signal(int)
 
+    # Shared by every toggle; paintEvent runs on each animation frame.
+    _OFF_COLOR = QColor(COLOR_BG_RAISED)
+    _ON_COLOR = QColor(COLOR_ACCENT)
+    _SHADOW_COLOR = QColor(0, 0, 0, 30)
+    _KNOB_COLOR = QColor(255, 255, 255)
+    _TEXT_COLOR = QColor(COLOR_TEXT)
+    # (on, devicePixelRatio, track_w, track_h) -> QPixmap of the resting pill.
+    _pill_cache = {}
+
     def __init__(self, label_text="", checked=False, parent=None):
         super().__init__(parent)
         self._checked = checked
@@ -53,6 +65,9 @@ class ToggleSwitch(QWidget):
         self._knob_margin = 2
         self._knob_size = self._track_h - 2 * self._knob_margin
         self._label_gap = 10
+        # Font-metrics results for the fixed label, reset on FontChange.
+        self._size_hint = None
+        self._text_y_adjust = None
 
         # Animation
         self._anim = QPropertyAnimation(self, b"knob_position")
@@ -98,33 +113,34 @@ class ToggleSwitch(QWidget):
             self._animate(self._checked)
             self.stateChanged.emit(1 if self._checked else 0)
 
-    def sizeHint(self):
-        fm = self.fontMetrics()
-        text_w = fm.horizontalAdvance(self._label_text) if self._label_text else 0
-        total_w = self._track_w + (self._label_gap + text_w if text_w else 0)
-        return QSize(total_w + 4, max(self._track_h + 4, fm.height() + 4))
-
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._size_hint = None
+            self._text_y_adjust = None
+        super().changeEvent(event)
 
-        y_offset = (self.height() - self._track_h) // 2
-        # Toggles without a label (AxesCard rows) center the pill inside
-        # their widget bounds so the spacing reads symmetric on both
-        # sides. Labeled toggles (sidebar Autostart/Actions/…) keep the
-        # pill at x=0 with the label rendered to its right.
-        x_offset = 0 if self._label_text else (self.width() - self._track_w) // 2
-
-        # Track colors
-        off_color = QColor(0x45, 0x47, 0x5A)
-        on_color = QColor(0x52, 0x94, 0xE2)
-
-        # Interpolate track color
-        t = self._knob_x
-        r = int(off_color.red() + t * (on_color.red() - off_color.red()))
-        g = int(off_color.green() + t * (on_color.green() - off_color.green()))
-        b = int(off_color.blue() + t * (on_color.blue() - off_color.blue()))
-        track_color = QColor(r, g, b)
+    def sizeHint(self):
+        if self._size_hint is None:
+            fm = self.fontMetrics()
+            text_w = fm.horizontalAdvance(self._label_text) if self._label_text else 0
+            total_w = self._track_w + (self._label_gap + text_w if text_w else 0)
+            self._size_hint = QSize(total_w + 4, max(self._track_h + 4, fm.height() + 4))
+        return QSize(self._size_hint)
+
+    def _paint_pill(self, p, x_offset, y_offset, t):
+        """Draw track and knob with the knob at animation position *t*."""
+        # Interpolate track color; the endpoints need no new QColor.
+        if t <= 0.0:
+            track_color = self._OFF_COLOR
+        elif t >= 1.0:
+            track_color = self._ON_COLOR
+        else:
+            off, on = self._OFF_COLOR, self._ON_COLOR
+            track_color = QColor(
+                int(off.red() + t * (on.red() - off.red())),
+                int(off.green() + t * (on.green() - off.green())),
+                int(off.blue() + t * (on.blue() - off.blue())),
+            )
 
         # Draw track (pill shape)
         p.setPen(Qt.PenStyle.NoPen)
@@ -135,24 +151,60 @@ class ToggleSwitch(QWidget):
 
         # Draw knob (white circle)
         knob_travel = self._track_w - self._knob_size - 2 * self._knob_margin
-        knob_x = x_offset + self._knob_margin + self._knob_x * knob_travel
+        knob_x = x_offset + self._knob_margin + t * knob_travel
         knob_y = y_offset + self._knob_margin
 
         # Subtle shadow
-        p.setBrush(QColor(0, 0, 0, 30))
+        p.setBrush(self._SHADOW_COLOR)
         p.drawEllipse(int(knob_x), int(knob_y + 1), self._knob_size, self._knob_size)
 
         # White knob
-        p.setBrush(QColor(255, 255, 255))
+        p.setBrush(self._KNOB_COLOR)
         p.drawEllipse(int(knob_x), int(knob_y), self._knob_size, self._knob_size)
 
+    def _resting_pill(self, on):
+        """Rendered fully-on or fully-off pill, shared by all toggles."""
+        dpr = self.devicePixelRatioF()
+        key = (on, dpr, self._track_w, self._track_h)
+        pixmap = self._pill_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(self._track_w * dpr), round(self._track_h * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            p = QPainter(pixmap)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._paint_pill(p, 0, 0, 1.0 if on else 0.0)
+            p.end()
+            self._pill_cache[key] = pixmap
+        return pixmap
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        y_offset = (self.height() - self._track_h) // 2
+        # Toggles without a label (AxesCard rows) center the pill inside
+        # their widget bounds so the spacing reads symmetric on both
+        # sides. Labeled toggles (sidebar Autostart/Actions/…) keep the
+        # pill at x=0 with the label rendered to its right.
+        x_offset = 0 if self._label_text else (self.width() - self._track_w) // 2
+
+        # Only the ~12 animation frames rasterize the pill; at rest every
+        # toggle blits the shared pixmap for its state.
+        t = self._knob_x
+        if t in (0.0, 1.0):
+            p.drawPixmap(x_offset, y_offset, self._resting_pill(t == 1.0))
+        else:
+            self._paint_pill(p, x_offset, y_offset, t)
+
         # Draw label text
         if self._label_text:
-            p.setPen(QColor(0xCD, 0xD6, 0xF4))
+            p.setPen(self._TEXT_COLOR)
+            if self._text_y_adjust is None:
+                fm = self.fontMetrics()
+                self._text_y_adjust = fm.ascent() - fm.descent()
             text_x = self._track_w + self._label_gap
-            text_y = (
-                self.height() + self.fontMetrics().ascent() - self.fontMetrics().descent()
-            ) // 2
+            text_y = (self.height() + self._text_y_adjust) // 2
             p.drawText(text_x, text_y, self._label_text)
 
         p.end()
@@ -342,6 +394,7 @@ class AxesCard(QWidget):
         layout.addWidget(card)
         self._building = False
 
+    @Slot()
     def _emit_changed(self):
         if not self._building:
             self.changed.emit()
@@ -368,12 +421,18 @@ class AxisBar(QWidget):
     _AXIS_RANGE = 400
 
     def setValue(self, val):
-        self._value = max(-self._AXIS_RANGE, min(self._AXIS_RANGE, val))
-        self.update()
+        # Resting axes report 0 over and over; only schedule a repaint
+        # when the clamped value actually moves.
+        val = max(-self._AXIS_RANGE, min(self._AXIS_RANGE, val))
+        if val != self._value:
+            self._value = val
+            self.update()
 
     def setDeadzone(self, dz):
-        self._deadzone = max(0, min(self._AXIS_RANGE, dz))
-        self.update()
+        dz = max(0, min(self._AXIS_RANGE, dz))
+        if dz != self._deadzone:
+            self._deadzone = dz
+            self.update()
 
     def paintEvent(self, event):
         p = QPainter(self)
@@ -426,8 +485,18 @@ class AxisBar(QWidget):
 class LivePreviewBar(QWidget):
     """Compact horizontal live preview bar with deadzone visualization."""
 
+    _CHIP_STYLE_PRESSED = (
+        f"background: {COLOR_OK}; color: {COLOR_BG_BASE}; "
+        f"font-size: 10px; font-weight: bold; border-radius: 4px;"
+    )
+    _CHIP_STYLE_RELEASED = (
+        f"background: {COLOR_BG_RAISED}; color: {COLOR_TEXT_MUTED}; "
+        f"font-size: 10px; font-weight: bold; border-radius: 4px;"
+    )
+
     def __init__(self):
         super().__init__()
+        self._daemon_connected = None
         self.setObjectName("live-bar")
         self.setFixedHeight(104)
 
@@ -459,9 +528,9 @@ class LivePreviewBar(QWidget):
         # \u2500\u2500 Row 2: axis bars \u2500\u2500
         axes = QHBoxLayout()
         axes.setSpacing(6)
-        lbl = QLabel("Live:")
-        lbl.setStyleSheet(section_style)
-        axes.addWidget(lbl)
+        self._live_label = QLabel("Live:")
+        self._live_label.setStyleSheet(section_style)
+        axes.addWidget(self._live_label)
         self.bars = []
         short_names = ["TX", "TY", "TZ", "RX", "RY", "RZ"]
         for name in short_names:
@@ -471,6 +540,9 @@ class LivePreviewBar(QWidget):
             bar = AxisBar()
             axes.addWidget(bar, 1)
             self.bars.append(bar)
+        # Hot path: update_axes runs for every coalesced motion frame.
+        self._bar_setters = tuple(bar.setValue for bar in self.bars)
+        self._last_axes = None
         outer.addLayout(axes)
         outer.addSpacing(8)
 
@@ -485,13 +557,28 @@ class LivePreviewBar(QWidget):
         self.btn_chips_layout.setContentsMargins(0, 0, 0, 0)
         bottom.addLayout(self.btn_chips_layout)
         self.btn_chips = {}
+        # Last state applied per chip; setStyleSheet re-parses and
+        # re-polishes, so a repeated press/release must not reach it.
+        self._chip_pressed = {}
         bottom.addStretch()
         outer.addLayout(bottom)
 
+    @Slot(list)
     def update_axes(self, values):
-        for i, val in enumerate(values):
-            if i < len(self.bars):
-                self.bars[i].setValue(val)
+        # One C-level list compare skips the per-bar calls when a frame
+        # repeats the previous one (e.g. a held deflection).
+        if values == self._last_axes:
+            return
+        self._last_axes = values
+        for set_value, val in zip(self._bar_setters, values):
+            set_value(val)
+
+    def set_preview_available(self, available):
+        """Grey out the axis row when no live events can arrive (no libspnav)."""
+        tip = "" if available else "libspnav not found — live preview unavailable"
+        for w in (self._live_label, *self.bars):
+            w.setEnabled(available)
+            w.setToolTip(tip)
 
     def set_deadzones(self, values):
         """Update deadzone visualization on all 6 axis bars."""
@@ -499,12 +586,16 @@ class LivePreviewBar(QWidget):
             if i < len(self.bars):
                 self.bars[i].setDeadzone(dz)
 
+    @Slot(int, bool)
     def update_button(self, bnum, pressed):
         if bnum < 0:
             return
         chip = self.btn_chips.get(bnum)
         if chip is None:
             chip = self._add_button_chip(bnum)
+        if self._chip_pressed.get(bnum) == pressed:
+            return
+        self._chip_pressed[bnum] = pressed
         self._style_button_chip(chip, pressed)
 
     def _add_button_chip(self, bnum):
@@ -513,24 +604,16 @@ class LivePreviewBar(QWidget):
         chip.setFixedSize(22, 20)
         chip.setToolTip(f"Button {bnum + 1}")
         self._style_button_chip(chip, False)
+        self._chip_pressed[bnum] = False
         # Insert sorted by bnum so chips stay ordered as they appear.
         insert_at = sum(1 for b in self.btn_chips if b < bnum)
         self.btn_chips_layout.insertWidget(insert_at, chip)
         self.btn_chips[bnum] = chip
         return chip
 
-    @staticmethod
-    def _style_button_chip(chip, pressed):
-        if pressed:
-            chip.setStyleSheet(
-                f"background: {COLOR_OK}; color: {COLOR_BG_BASE}; "
-                f"font-size: 10px; font-weight: bold; border-radius: 4px;"
-            )
-        else:
-            chip.setStyleSheet(
-                f"background: {COLOR_BG_RAISED}; color: {COLOR_TEXT_MUTED}; "
-                f"font-size: 10px; font-weight: bold; border-radius: 4px;"
-            )
+    @classmethod
+    def _style_button_chip(cls, chip, pressed):
+        chip.setStyleSheet(cls._CHIP_STYLE_PRESSED if pressed else cls._CHIP_STYLE_RELEASED)
 
     def seed_buttons(self, bnums):
         """Pre-populate chips for known buttons (e.g. from config)."""
@@ -556,6 +639,11 @@ class LivePreviewBar(QWidget):
         self.profile_label.setText(f"Profile: {display}")
 
     def set_daemon_status(self, connected):
+        # Polled while the window is visible; restyling is not free, so
+        # only touch the dot when the state actually flips.
+        if connected == self._daemon_connected:
+            return
+        self._daemon_connected = connected
         if connected:
             self.status_dot.setStyleSheet(f"font-size: 12px; color: {COLOR_OK};")
             self.status_dot.setToolTip("Daemon: connected")
@@ -134,9 +134,10 @@ case "$DISTRO_FAMILY" in
         # PySide6 availability:
         #   Debian 12 (bookworm)        — not in apt (added in Debian 13)
         #   Ubuntu 24.04 LTS (noble)    — not in apt (added in 24.10)
-        #   Newer releases              — apt package: python3-pyside6.qtwidgets
+        #   Newer releases              — apt packages: python3-pyside6.qtwidgets
+        #                                 (+ .qtdbus for the KWin window monitor)
         if apt-cache show python3-pyside6.qtwidgets &>/dev/null; then
-            OFFICIAL_PKGS+=(python3-pyside6.qtwidgets)
+            OFFICIAL_PKGS+=(python3-pyside6.qtwidgets python3-pyside6.qtdbus)
         else
             warn "PySide6 is not in your apt repositories (Debian 12 / Ubuntu 24.04 or older)."
             warn "Will set up a Python venv with pip-installed PySide6 instead."
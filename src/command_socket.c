@@ -135,6 +135,9 @@ void cmd_handle_client(int listen_fd)
 		snprintf(response, sizeof(response), "ERR unknown command\n");
 	}
 
-	write(cfd, response, strlen(response));
+	/* Fire-and-forget clients (post_daemon_cmd) close without reading
+	 * the reply; MSG_NOSIGNAL turns that into a harmless EPIPE instead
+	 * of a SIGPIPE that would kill the daemon. */
+	send(cfd, response, strlen(response), MSG_NOSIGNAL);
 	close(cfd);
 }
@@ -12,7 +12,8 @@
  *
  * Connections are accept()ed one at a time from the daemon's main poll
  * loop; the socket is non-blocking so a stuck client cannot stall the
- * event loop.
+ * event loop. Clients may close right after sending a command without
+ * reading the reply — the daemon ignores the resulting EPIPE.
  */
 #ifndef SPACEMOUSE_COMMAND_SOCKET_H
 #define SPACEMOUSE_COMMAND_SOCKET_H
@@ -77,3 +77,19 @@ def test_defaults_has_all_documented_keys():
         "ndof_panz_invert_axis",
     }
     assert documented == set(backends.BlenderConfig.DEFAULTS.keys())
+
+
+def test_read_reuses_parse_until_file_changes(cfg, monkeypatch):
+    bc, target = cfg
+    target.write_text(json.dumps({"ndof_sensitivity": 2.5}))
+    bc.read()["ndof_sensitivity"] = 0.0  # callers get a copy, not the memo
+
+    calls = []
+    real_load = json.load
+    monkeypatch.setattr(json, "load", lambda f: calls.append(f) or real_load(f))
+    assert bc.read()["ndof_sensitivity"] == 2.5
+    assert calls == []
+
+    target.write_text(json.dumps({"ndof_sensitivity": 0.75}))
+    assert bc.read()["ndof_sensitivity"] == 0.75
+    assert len(calls) == 1
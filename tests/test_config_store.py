@@ -0,0 +1,40 @@
+"""Tests for config.json serialisation + atomic write."""
+
+import json
+
+from spacemouse_config.config_store import load_config, serialize_config, write_config
+
+
+def test_serialize_preserves_profile_order():
+    # First-match-wins profile lookup depends on insertion order, so the
+    # serialiser must not sort keys.
+    config = {"profiles": {"zeta": {}, "alpha": {}, "default": {}}}
+    assert list(json.loads(serialize_config(config))["profiles"]) == ["zeta", "alpha", "default"]
+
+
+def test_serialize_is_stable():
+    config = {"profiles": {"default": {"deadzone": 15}}, "settings": {"bg_test": False}}
+    assert serialize_config(config) == serialize_config(json.loads(serialize_config(config)))
+
+
+def test_write_config_creates_dir_and_replaces(tmp_path):
+    path = tmp_path / "spacemouse" / "config.json"
+    write_config(path, b'{"a": 1}')
+    write_config(path, b'{"a": 2}')
+    assert path.read_bytes() == b'{"a": 2}'
+    # The temp file is renamed over the target, never left behind.
+    assert [p.name for p in path.parent.iterdir()] == ["config.json"]
+
+
+def test_load_config_round_trip(tmp_path):
+    path = tmp_path / "config.json"
+    config = {"profiles": {"default": {"deadzone": 15}}}
+    write_config(path, serialize_config(config))
+    assert load_config(path) == config
+
+
+def test_load_config_missing_or_corrupt(tmp_path):
+    path = tmp_path / "config.json"
+    assert load_config(path) is None
+    path.write_bytes(b'{"profiles": ')
+    assert load_config(path) is None
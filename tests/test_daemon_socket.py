@@ -74,6 +74,52 @@ def test_returns_true_once_socket_appears_mid_wait(patched_sock_path):
             holder[0].close()
 
 
+# ── send_daemon_cmd() ────────────────────────────────────────────────
+
+
+def _serve_one(server, response):
+    """Mimic the daemon: accept one client, read its line, reply, close."""
+    conn, _ = server.accept()
+    with conn:
+        received = conn.recv(256)
+        conn.sendall(response)
+    return received
+
+
+def test_send_daemon_cmd_round_trip(patched_sock_path):
+    server = _listen_unix(patched_sock_path)
+    received = []
+    t = threading.Thread(target=lambda: received.append(_serve_one(server, b"OK reloading\n")))
+    t.start()
+    try:
+        assert daemon_socket.send_daemon_cmd("RELOAD") == "OK reloading"
+    finally:
+        t.join()
+        server.close()
+    assert received == [b"RELOAD\n"]
+
+
+def test_send_daemon_cmd_returns_none_without_daemon(patched_sock_path):
+    assert daemon_socket.send_daemon_cmd("STATUS") is None
+
+
+def test_post_daemon_cmd_does_not_wait_for_reply(patched_sock_path):
+    server = _listen_unix(patched_sock_path)
+    try:
+        # Nobody is accepting yet: the command must still go out, buffered
+        # in the listen backlog, and the call must return immediately.
+        assert daemon_socket.post_daemon_cmd("PROFILE default") is True
+        conn, _ = server.accept()
+        with conn:
+            assert conn.recv(256) == b"PROFILE default\n"
+    finally:
+        server.close()
+
+
+def test_post_daemon_cmd_returns_false_without_daemon(patched_sock_path):
+    assert daemon_socket.post_daemon_cmd("RELOAD") is False
+
+
 # ── query_device_info() ──────────────────────────────────────────────
 
 
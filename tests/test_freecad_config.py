@@ -139,3 +139,31 @@ def test_write_creates_missing_groups(tmp_path):
     assert spaceball is not None
     btn0 = spaceball.find("FCParamGroup[@Name='Buttons']/FCParamGroup[@Name='0']")
     assert btn0 is not None
+
+
+def test_read_reuses_parse_until_file_changes(cfg, cfg_path, monkeypatch):
+    first = cfg.read()
+    first["global_sensitivity"] = 0  # callers get a copy, not the memo
+
+    calls = []
+    real_parse = ET.parse
+    monkeypatch.setattr(ET, "parse", lambda *a: calls.append(a) or real_parse(*a))
+    assert cfg.read()["global_sensitivity"] == -15
+    assert calls == []
+
+    cfg_path.write_text(MINIMAL_USER_CFG.replace('Value="-15"', 'Value="-7"'))
+    assert cfg.read()["global_sensitivity"] == -7
+    assert len(calls) == 1
+
+
+def test_is_running_matches_process_name_like_pgrep(tmp_path, monkeypatch):
+    proc = tmp_path / "proc"
+    for pid, comm in (("1", "systemd\n"), ("42", "freecad\n"), ("43", "FreeCADCmd\n")):
+        (proc / pid).mkdir(parents=True)
+        (proc / pid / "comm").write_text(comm)
+    (proc / "self").mkdir()
+    monkeypatch.setattr(FreeCADConfig, "_PROC_DIR", str(proc))
+    assert FreeCADConfig.is_running() is True
+
+    (proc / "42" / "comm").unlink()  # FreeCAD exited; FreeCADCmd is not it
+    assert FreeCADConfig.is_running() is False
@@ -1,6 +1,10 @@
 """Tests for the WM-class → profile-name matcher."""
 
-from spacemouse_config.profile_match import find_matching_profile
+from spacemouse_config.profile_match import (
+    MATCH_CACHE_SIZE,
+    ProfileMatcher,
+    find_matching_profile,
+)
 
 PROFILES = {
     "default": {"match_wm_class": []},
@@ -71,3 +75,52 @@ def test_first_match_wins():
 
 def test_empty_profiles():
     assert find_matching_profile("anything", {}) == "default"
+
+
+def test_matcher_agrees_with_function():
+    matcher = ProfileMatcher(PROFILES)
+    for wm_class in ("blender", "Navigator.firefox", "FreeCAD-1.1", "unknown"):
+        assert matcher.match(wm_class) == find_matching_profile(wm_class, PROFILES)
+        # Second lookup is served from the memo and must agree.
+        assert matcher.match(wm_class) == find_matching_profile(wm_class, PROFILES)
+
+
+def test_matcher_cache_is_bounded():
+    matcher = ProfileMatcher(PROFILES)
+    for i in range(MATCH_CACHE_SIZE * 2):
+        assert matcher.match(f"app-{i}") == "default"
+    assert len(matcher._cache) == MATCH_CACHE_SIZE
+    assert matcher.match("firefox") == "browser"
+
+
+def test_matcher_first_profile_beats_leftmost_match():
+    # "fox" appears later in the string than "navigator", but its profile
+    # comes first — profile order decides, not match position.
+    profiles = {
+        "default": {},
+        "fox": {"match_wm_class": ["fox"]},
+        "nav": {"match_wm_class": ["Navigator"]},
+    }
+    assert ProfileMatcher(profiles).match("Navigator.firefox") == "fox"
+
+
+def test_matcher_escapes_pattern_metacharacters():
+    profiles = {"default": {}, "kate": {"match_wm_class": ["org.kde.kate"]}}
+    matcher = ProfileMatcher(profiles)
+    assert matcher.match("org.kde.kate") == "kate"
+    assert matcher.match("orgXkdeXkate") == "default"
+
+
+def test_matcher_exact_class_keeps_first_profile_wins():
+    # "firefox" is its own profile's exact pattern, but the earlier "fox"
+    # profile's pattern is a substring of it and must still win.
+    profiles = {
+        "default": {},
+        "fox": {"match_wm_class": ["fox"]},
+        "browser": {"match_wm_class": ["firefox"]},
+    }
+    matcher = ProfileMatcher(profiles)
+    assert matcher.match("Firefox") == "fox"
+    assert matcher.match("fox") == "fox"
+    # Exact hits are answered by the index without filling the memo.
+    assert matcher._cache == {}